@@ -0,0 +1,50 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import ta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from iusa_archive import append_bars, read_bars
+
+# Load time and peak RSS of RSI-on-Close from a CSV export versus the
+# memory-mapped columnar archive. Each path runs in its own process so the
+# RSS numbers don't mix.
+BARS = 2_000_000  # ~5 years of 1-minute bars at 6.5 trading hours a day
+
+def make_data(workdir):
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2020-01-01', periods=BARS, freq='min', tz='UTC')
+    close = 300 + rng.standard_normal(BARS).cumsum() * 0.05
+    df = pd.DataFrame({'Open': close, 'High': close + 0.1, 'Low': close - 0.1, 'Close': close,
+                       'Volume': rng.integers(0, 10000, BARS).astype(float)}, index=index)
+    df.index.name = 'Date'
+    df.to_csv(os.path.join(workdir, 'bars.csv'))
+    append_bars(df, 'BENCH', '1m', root=workdir)
+
+def run(mode, workdir):
+    start = time.perf_counter()
+    if mode == 'csv':
+        close = pd.read_csv(os.path.join(workdir, 'bars.csv'), index_col='Date', parse_dates=['Date'])['Close']
+    else:
+        close = read_bars('BENCH', '1m', columns=['Close'], root=workdir)['Close']
+    loaded = time.perf_counter() - start
+    ta.momentum.RSIIndicator(close=close, window=14).rsi()
+    total = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{mode:>8}: load {loaded * 1000:8.1f} ms | load+RSI {total * 1000:8.1f} ms | peak RSS {peak_mb:7.1f} MB')
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            make_data(workdir)
+            print(f'{BARS} bars, 5 columns')
+            for mode in ('csv', 'archive'):
+                subprocess.run([sys.executable, __file__, mode, workdir], check=True)
@@ -0,0 +1,43 @@
+import os
+import resource
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from iusa_charts import render_png
+from iusa_indicators import IndicatorEngine
+
+# 1,000 dashboard reruns through the chart layer, with the last bar changing
+# every rerun (worst case: nothing is served from the image cache). RSS should
+# stay flat; the unchanged-data rerun shows the cache-hit cost.
+RERUNS = 1000
+BARS = 1500
+
+def rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+rng = np.random.default_rng(0)
+index = pd.date_range('2024-01-01', periods=BARS + RERUNS, freq='h')
+close = pd.DataFrame({'Close': 300 + rng.standard_normal(BARS + RERUNS).cumsum()}, index=index)
+full = close.join(IndicatorEngine().extend(close))
+
+start = time.perf_counter()
+for i in range(RERUNS):
+    df = full.iloc[i:i + BARS]
+    for name in ('price', 'macd', 'rsi'):
+        render_png(name, df, name)
+    if i % 100 == 0 or i == RERUNS - 1:
+        print(f'rerun {i:4d}: RSS {rss_mb():7.1f} MB')
+per_rerun = (time.perf_counter() - start) / RERUNS
+
+start = time.perf_counter()
+for name in ('price', 'macd', 'rsi'):
+    render_png(name, df, name)
+cached = time.perf_counter() - start
+
+print(f'changed data: {per_rerun * 1000:.1f} ms per rerun (3 charts)')
+print(f'unchanged data: {cached * 1000:.2f} ms per rerun (cache hit)')
+print(f'peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB')
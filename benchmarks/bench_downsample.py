@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import iusa_charts
+from iusa_indicators import IndicatorEngine
+
+# Per-chart (price / MACD / RSI) render time against history length, with and without
+# thinning. The figures are built once up front (as on a running server) and
+# the image cache is emptied before every render, so each one rasterizes.
+LENGTHS = [1_000, 10_000, 87_600, 500_000]
+
+rng = np.random.default_rng(0)
+longest = max(LENGTHS)
+index = pd.date_range('2010-01-01', periods=longest, freq='h')
+close = pd.DataFrame({'Close': 300 + rng.standard_normal(longest).cumsum() * 0.2}, index=index)
+full = close.join(IndicatorEngine().extend(close))
+
+# Slowest of the three charts, in ms
+def render_ms(df, method):
+    iusa_charts.THIN_METHOD = method
+    iusa_charts.clear_cache(figures=False)
+    times = []
+    for name in ('price', 'macd', 'rsi'):
+        start = time.perf_counter()
+        iusa_charts.render_png(name, df, name)
+        times.append((time.perf_counter() - start) * 1000)
+    return max(times)
+
+for name in ('price', 'macd', 'rsi'):
+    iusa_charts.render_png(name, full.iloc[:1_000], name)
+
+for length in LENGTHS:
+    df = full.iloc[-length:]
+    row = {method or 'none': render_ms(df, method) for method in ('minmax', 'lttb', None)}
+    print(f'{length:>8} bars: ' + ' | '.join(f'{k} {v:8.1f} ms' for k, v in row.items()))
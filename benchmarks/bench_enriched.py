@@ -0,0 +1,78 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import iusa_enriched
+
+# Rows/sec and peak RSS of loading a large signal export shaped like
+# iusa_enriched_data.csv: pandas inference, the typed CSV reader (whole file and
+# chunked), the first read that also builds the columnar cache, and later reads
+# from the cache (float64 and float32 indicators). Every mode touches each
+# column once so memory-mapped reads are paid for. Each mode runs in its own
+# process; "+peak" is the peak RSS above the process after its imports.
+ROWS = 2_000_000
+CHUNK_ROWS = iusa_enriched.CHUNK_ROWS
+MODES = ['read_csv', 'typed', 'chunked', 'first read', 'cached', 'cached f32', 'cached chunks']
+
+def make_data(path):
+    rng = np.random.default_rng(0)
+    close = 300 + rng.standard_normal(ROWS).cumsum() * 0.05
+    df = pd.DataFrame({
+        'Close': close,
+        '50_MA': close + rng.standard_normal(ROWS),
+        '200_MA': close + rng.standard_normal(ROWS),
+        'RSI': rng.uniform(0, 100, ROWS),
+        'MACD': rng.standard_normal(ROWS),
+        'MACD_Signal': rng.standard_normal(ROWS),
+        'Signal': rng.choice(['BUY', 'HOLD', 'SELL'], ROWS),
+    }, index=pd.date_range('2020-01-01 09:30:00.460896', periods=ROWS, freq='min', name='Date'))
+    df.to_csv(path)
+
+def touch(df):
+    for column in df.columns:
+        values = df[column]
+        values.cat.codes.sum() if isinstance(values.dtype, pd.CategoricalDtype) else values.sum()
+    return len(df)
+
+def run(mode, path, cache_root):
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == 'read_csv':
+        rows = touch(pd.read_csv(path, index_col='Date', parse_dates=['Date']))
+    elif mode == 'typed':
+        rows = touch(iusa_enriched.read_csv_typed(path))
+    elif mode == 'chunked':
+        rows = sum(touch(chunk) for chunk in iusa_enriched.iter_csv(path, CHUNK_ROWS))
+    elif mode == 'first read':
+        rows = touch(iusa_enriched.load_enriched(path, root=cache_root))
+    elif mode == 'cached':
+        rows = touch(iusa_enriched.load_enriched(path, root=cache_root))
+    elif mode == 'cached f32':
+        rows = touch(iusa_enriched.load_enriched(path, float32=True, root=cache_root))
+    else:
+        rows = sum(touch(chunk) for chunk in iusa_enriched.iter_enriched(path, CHUNK_ROWS, root=cache_root))
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'{mode:>13}: {seconds * 1000:9.1f} ms | {rows / seconds:12,.0f} rows/s | '
+          f'+peak {(peak - base) / 1024:7.1f} MB')
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        make_data(sys.argv[2])
+    elif len(sys.argv) == 4:
+        run(*sys.argv[1:])
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, 'enriched.csv')
+            # Generated in a child too: Linux carries ru_maxrss across fork/exec
+            subprocess.run([sys.executable, __file__, 'make', path], check=True)
+            print(f'{ROWS:,} rows, {os.path.getsize(path) / 2**20:.0f} MB CSV, chunks of {CHUNK_ROWS:,}')
+            for mode in MODES:
+                subprocess.run([sys.executable, __file__, mode, path, os.path.join(workdir, 'cache')], check=True)
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start import cost of the dashboard entry point, from `python -X importtime`.
+# Imports exactly what iusa_dashboard.py imports before its first st.title(), in a
+# fresh interpreter per run, and reports the total, the slowest top-level
+# packages, and any heavy module that got pulled in before the first render
+# (those should only load on the code paths that use them).
+ENTRY_IMPORTS = ['streamlit', 'iusa_engine', 'iusa_backtest', 'iusa_sentiment', 'iusa_charts', 'iusa_cache']
+HEAVY = ['matplotlib', 'mplfinance', 'textblob', 'nltk', 'yfinance', 'bs4', 'requests', 'ta', 'pytz']
+RUNS = 5
+TOP = 10
+
+def import_once():
+    code = (f'import sys; import {", ".join(ENTRY_IMPORTS)}; '
+            f'print(",".join(m for m in {HEAVY!r} if m in sys.modules))')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    # Lines look like "import time:   self [us] | cumulative | <indent>package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cum, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            cumulative[name.strip()] = int(cum)
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    return cumulative, loaded
+
+runs = [import_once() for _ in range(RUNS)]
+totals = sorted(sum(cumulative.values()) / 1000 for cumulative, _ in runs)
+print(f'entry imports: {totals[len(totals) // 2]:.0f} ms median of {RUNS} (min {totals[0]:.0f}, max {totals[-1]:.0f})')
+cumulative, loaded = runs[-1]
+for name, us in sorted(cumulative.items(), key=lambda item: -item[1])[:TOP]:
+    print(f'  {us / 1000:8.1f} ms  {name}')
+print('heavy modules loaded at start: ' + (', '.join(loaded) or 'none'))
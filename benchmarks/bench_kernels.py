@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+import ta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import iusa_kernels
+from iusa_indicators import IndicatorEngine
+
+# RSI + MACD + signal line + 50/200 SMA on 1M bars: ta (pandas ewm / rolling)
+# against the array kernels on each available backend, and a cold
+# IndicatorEngine.extend() that now runs through the kernels. Output buffers
+# are allocated once and reused across repeats.
+BARS = 1_000_000
+REPEATS = 5
+
+rng = np.random.default_rng(0)
+close = pd.Series(300 + rng.standard_normal(BARS).cumsum() * 0.2,
+                  index=pd.date_range('2000-01-01', periods=BARS, freq='h'))
+values = close.to_numpy()
+
+def with_ta():
+    ta.momentum.RSIIndicator(close=close, window=14).rsi()
+    macd = ta.trend.MACD(close=close)
+    macd.macd()
+    macd.macd_signal()
+    close.rolling(50).mean()
+    close.rolling(200).mean()
+
+buffers = [np.empty(BARS) for _ in range(5)]
+
+def with_kernels():
+    iusa_kernels.rsi(values, 14, out=buffers[0])
+    iusa_kernels.macd(values, 12, 26, 9, out=buffers[1], signal_out=buffers[2])
+    iusa_kernels.sma(values, 50, out=buffers[3])
+    iusa_kernels.sma(values, 200, out=buffers[4])
+
+def with_engine():
+    IndicatorEngine().extend(close.to_frame('Close'))
+
+def best_ms(fn):
+    fn()  # warm-up (numba compiles on first call)
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+baseline = best_ms(with_ta)
+print(f'{BARS:,} bars, best of {REPEATS}')
+print(f'  ta / pandas         {baseline:8.1f} ms')
+for backend in iusa_kernels.BACKENDS:
+    iusa_kernels.BACKEND = backend
+    ms = best_ms(with_kernels)
+    print(f'  kernels ({backend:5})     {ms:8.1f} ms  ({baseline / ms:.1f}x)')
+    ms = best_ms(with_engine)
+    print(f'  engine  ({backend:5})     {ms:8.1f} ms  (cold extend, DataFrame in and out)')
@@ -0,0 +1,110 @@
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# Columnar on-disk archive for long bar histories (years of 1m / 1h bars).
+# Each (ticker, interval) is a directory with one raw little-endian file per
+# column plus meta.json: index.i8 holds int64 UTC nanoseconds, every other
+# column is float64. Reads are memory-mapped and only open the columns asked
+# for, so an RSI on Close never touches Open/High/Low/Volume. Appends just
+# extend the files.
+
+# CONFIG
+ARCHIVE_DIR = os.environ.get('IUSA_ARCHIVE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bar_archive'))
+COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+INDEX_DTYPE = np.dtype('<i8')
+VALUE_DTYPE = np.dtype('<f8')
+
+def archive_path(ticker, interval, root=None):
+    safe_ticker = re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)
+    return os.path.join(root or ARCHIVE_DIR, f'{safe_ticker}_{interval}')
+
+def _column_file(path, name):
+    return os.path.join(path, 'index.i8' if name is None else f'{name}.f8')
+
+def read_meta(ticker, interval, root=None):
+    path = os.path.join(archive_path(ticker, interval, root), 'meta.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def _write_meta(path, meta):
+    tmp_path = os.path.join(path, 'meta.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(path, 'meta.json'))
+
+def _utc_ns(index):
+    index = pd.DatetimeIndex(index).as_unit('ns')
+    return (index.tz_convert(None) if index.tz is not None else index).asi8.astype(INDEX_DTYPE)
+
+# Append rows newer than the last archived bar (creates the archive if needed).
+# The column set is fixed by the first write.
+def append_bars(df, ticker, interval, root=None):
+    path = archive_path(ticker, interval, root)
+    meta = read_meta(ticker, interval, root)
+    if meta is None:
+        os.makedirs(path, exist_ok=True)
+        index = pd.DatetimeIndex(df.index)
+        meta = {'columns': [c for c in COLUMNS if c in df.columns] or list(df.columns),
+                'tz': str(index.tz) if index.tz is not None else None, 'length': 0, 'last': None}
+        for name in [None] + meta['columns']:
+            open(_column_file(path, name), 'wb').close()
+    stamps = _utc_ns(df.index)
+    if meta['last'] is not None:
+        newer = stamps > meta['last']
+        df, stamps = df[newer], stamps[newer]
+    if len(df) == 0:
+        return meta['length']
+    # The index file is written last and meta.json after it, so a crash mid-append
+    # leaves extra column bytes that read_bars ignores (it trusts meta length).
+    for name in meta['columns']:
+        values = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=VALUE_DTYPE)
+        with open(_column_file(path, name), 'r+b') as f:
+            f.seek(meta['length'] * VALUE_DTYPE.itemsize)
+            f.write(values.tobytes())
+    with open(_column_file(path, None), 'r+b') as f:
+        f.seek(meta['length'] * INDEX_DTYPE.itemsize)
+        f.write(stamps.tobytes())
+    meta['length'] += len(df)
+    meta['last'] = int(stamps[-1])
+    _write_meta(path, meta)
+    return meta['length']
+
+def _map(path, name, dtype, length):
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(_column_file(path, name), dtype=dtype, mode='r', shape=(length,))
+
+# Memory-mapped column, optionally sliced to [start, end]
+def read_column(ticker, interval, name, start=None, end=None, root=None):
+    meta = read_meta(ticker, interval, root)
+    if meta is None:
+        return None
+    path = archive_path(ticker, interval, root)
+    lo, hi = _bounds(path, meta, start, end)
+    return _map(path, name, VALUE_DTYPE, meta['length'])[lo:hi]
+
+def _bounds(path, meta, start, end):
+    if start is None and end is None:
+        return 0, meta['length']
+    stamps = _map(path, None, INDEX_DTYPE, meta['length'])
+    lo = 0 if start is None else int(np.searchsorted(stamps, _utc_ns([pd.Timestamp(start)])[0], 'left'))
+    hi = meta['length'] if end is None else int(np.searchsorted(stamps, _utc_ns([pd.Timestamp(end)])[0], 'right'))
+    return lo, hi
+
+# Bars as a DataFrame over memory-mapped columns; only the requested columns are opened
+def read_bars(ticker, interval, columns=None, start=None, end=None, root=None):
+    meta = read_meta(ticker, interval, root)
+    if meta is None:
+        return None
+    path = archive_path(ticker, interval, root)
+    lo, hi = _bounds(path, meta, start, end)
+    index = pd.DatetimeIndex(_map(path, None, INDEX_DTYPE, meta['length'])[lo:hi].view('datetime64[ns]'))
+    if meta['tz']:
+        index = index.tz_localize('UTC').tz_convert(meta['tz'])
+    data = {name: _map(path, name, VALUE_DTYPE, meta['length'])[lo:hi] for name in (columns or meta['columns'])}
+    return pd.DataFrame(data, index=index, copy=False)
@@ -0,0 +1,70 @@
+import argparse
+import numpy as np
+import pandas as pd
+from iusa_enriched import CSV_PATH, load_enriched
+from iusa_store import BARS_PER_DAY, TRADING_DAYS_PER_YEAR
+
+# Vectorized long-only backtester for the dashboard's BUY / HOLD / SELL labels.
+# A signal at the close of bar t sets the position held over bar t+1, so there is
+# no look-ahead; HOLD keeps the previous position.
+
+# CONFIG
+PERIODS_PER_YEAR = {interval: TRADING_DAYS_PER_YEAR * bars for interval, bars in BARS_PER_DAY.items()}
+
+# 'BUY', 'Buy', 'Buy (Momentum)' -> 1, 'SELL'/'Sell' -> 0, anything else -> keep
+def target_positions(signals, position_size=1.0):
+    labels = signals.astype(str).str.upper()
+    target = pd.Series(np.nan, index=signals.index)
+    target[labels.str.startswith('BUY')] = position_size
+    target[labels.str.startswith('SELL')] = 0.0
+    return target.ffill().fillna(0.0)
+
+def backtest(close, signals, position_size=1.0, fee_bps=0.0, slippage_bps=0.0,
+             initial_capital=10000.0, periods_per_year=252):
+    close = close.astype(float)
+    position = target_positions(signals.reindex(close.index), position_size)
+    held = position.shift(1).fillna(0.0)
+    bar_returns = close.pct_change().fillna(0.0)
+    turnover = position.diff().fillna(position).abs()
+    costs = turnover * (fee_bps + slippage_bps) / 10000.0
+    returns = held * bar_returns - costs
+    equity = initial_capital * (1.0 + returns).cumprod()
+    drawdown = equity / equity.cummax() - 1.0
+
+    # Trades: from the bar a position is taken (which pays the entry cost) to
+    # the bar it is closed on (which pays the exit cost), numbered from each entry
+    in_market = held > 0
+    in_trade = in_market | (position > 0)
+    entries = (position > 0) & ~in_market
+    trade_id = entries.cumsum().where(in_trade)
+    trade_returns = (1.0 + returns[in_trade]).groupby(trade_id[in_trade]).prod() - 1.0
+
+    years = len(close) / periods_per_year if periods_per_year else 0
+    total_return = equity.iloc[-1] / initial_capital - 1.0 if len(equity) else 0.0
+    stats = {
+        'total_return': total_return,
+        'annual_return': (1.0 + total_return) ** (1.0 / years) - 1.0 if years > 0 else np.nan,
+        'max_drawdown': drawdown.min() if len(drawdown) else 0.0,
+        'trades': int(len(trade_returns)),
+        'hit_rate': float((trade_returns > 0).mean()) if len(trade_returns) else np.nan,
+        'exposure': float(in_market.mean()) if len(in_market) else 0.0,
+        'fees_paid': float((costs * equity.shift(1).fillna(initial_capital)).sum()),
+    }
+    return {'equity': equity, 'returns': returns, 'position': held, 'drawdown': drawdown, 'stats': stats}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a Signal column (e.g. iusa_enriched_data.csv) against Close.')
+    parser.add_argument('csv', nargs='?', default=CSV_PATH)
+    parser.add_argument('--position-size', type=float, default=1.0)
+    parser.add_argument('--fee-bps', type=float, default=0.0)
+    parser.add_argument('--slippage-bps', type=float, default=0.0)
+    parser.add_argument('--periods-per-year', type=int, default=252)
+    args = parser.parse_args(argv)
+    df = load_enriched(args.csv, columns=['Close', 'Signal'])
+    result = backtest(df['Close'], df['Signal'], args.position_size, args.fee_bps, args.slippage_bps,
+                      periods_per_year=args.periods_per_year)
+    for name, value in result['stats'].items():
+        print(f'{name:>14}: {value:.4f}' if isinstance(value, float) else f'{name:>14}: {value}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import pandas as pd
+import yfinance as yf
+from iusa_engine import DEFAULT_PERIODS, INTERVAL, final_signal_series, get_news_sentiment, tech_signal_series
+from iusa_indicators import MA_WINDOWS, MACD_FAST, MACD_SIGNAL, MACD_SLOW, RSI_WINDOW
+
+# Watchlist mode: one grouped yfinance download, indicators computed for all
+# tickers at once, one row per ticker in the result.
+
+# One grouped download -> {field: frame of dates x tickers}
+def download_batch(tickers, interval=INTERVAL, period=None):
+    period = period or DEFAULT_PERIODS.get(interval, '60d')
+    data = yf.download(list(tickers), period=period, interval=interval, group_by='column', threads=True)
+    if not isinstance(data.columns, pd.MultiIndex):
+        data.columns = pd.MultiIndex.from_product([data.columns, list(tickers)[:1]])
+    return {field: data[field].dropna(how='all') for field in data.columns.get_level_values(0).unique()}
+
+# Apply a pandas window op per ticker and line the result up with the input
+def _by_ticker(series, window_op):
+    result = window_op(series.groupby(level='Ticker', sort=False))
+    if result.index.nlevels > series.index.nlevels:
+        result = result.droplevel(0)
+    return result.reindex(series.index)
+
+def _ema(series, span):
+    return _by_ticker(series, lambda g: g.ewm(span=span, min_periods=span, adjust=False).mean())
+
+def _wilder(series):
+    return _by_ticker(series, lambda g: g.ewm(alpha=1 / RSI_WINDOW, min_periods=RSI_WINDOW, adjust=False).mean())
+
+# RSI / MACD / SMAs for every ticker of a wide Close frame. Works on the stacked
+# (Date, Ticker) series so each ticker only sees its own bars, as in add_indicators().
+def add_indicators_batch(close):
+    long = close.stack().dropna().rename('Close')
+    long.index.names = ['Date', 'Ticker']
+
+    change = long.groupby(level='Ticker', sort=False).diff().fillna(0.0)
+    avg_up = _wilder(change.clip(lower=0))
+    avg_down = _wilder((-change).clip(lower=0))
+    rsi = (100 - 100 / (1 + avg_up / avg_down)).where(avg_down != 0, 100.0).where(avg_down.notna())
+
+    macd = _ema(long, MACD_FAST) - _ema(long, MACD_SLOW)
+    out = pd.DataFrame({'Close': long, 'RSI': rsi, 'MACD': macd, 'Signal_Line': _ema(macd, MACD_SIGNAL)})
+    for window in MA_WINDOWS:
+        out[f'{window}_MA'] = _by_ticker(long, lambda g: g.rolling(window).mean())
+    return out
+
+# ticker -> signal table for a whole watchlist
+def compute_batch(tickers, interval=INTERVAL, period=None, news=False):
+    fields = download_batch(tickers, interval, period)
+    indicators = add_indicators_batch(fields['Close'])
+    latest = indicators.groupby(level='Ticker', sort=False).tail(1).reset_index(level='Date')
+    latest['tech_signal'] = tech_signal_series(latest)
+    # News is market-wide, so it is scraped once for the whole watchlist
+    news_score, triggers, _ = get_news_sentiment() if news else (0, 0, [])
+    latest['signal'] = final_signal_series(latest['tech_signal'], news_score, triggers)
+    return latest.reindex([t for t in tickers if t in latest.index])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Evaluate the signal rules across a watchlist.')
+    parser.add_argument('tickers', nargs='*')
+    parser.add_argument('--file', help='watchlist file, one ticker per line')
+    parser.add_argument('--interval', default='1d')
+    parser.add_argument('--period', default=None)
+    parser.add_argument('--news', action='store_true', help='also scrape news sentiment')
+    args = parser.parse_args(argv)
+    tickers = list(args.tickers)
+    if args.file:
+        with open(args.file) as f:
+            tickers += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    table = compute_batch(tickers, args.interval, args.period, news=args.news)
+    print(table.to_string())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import time
+import pandas as pd
+import streamlit as st
+import iusa_news
+import iusa_timeframes
+from iusa_engine import DEFAULT_PERIODS, add_indicators, fetch_data
+from iusa_scheduler import RefreshScheduler, load_news_snapshot
+from iusa_store import read_stored_bars, window_bars
+from iusa_timeframes import BASE_PERIODS, TIMEFRAME_BASES, TIMEFRAME_PERIODS, timeframe_bars
+
+# Streamlit caching for the dashboard pipeline, split into stages so a widget
+# change only recomputes the stage it affects:
+#   bars        per (ticker, interval, period), refreshed per interval TTL
+#   indicators  per bar-set hash
+#   news        per source inside iusa_news (TTL + revalidation); the combined
+#               score comes from the scheduler's news snapshot
+# With the background scheduler running, bars and news are read from its
+# snapshots instead (snapshot_bars / snapshot_news). Timeframes are resampled
+# from the stored base feeds (cached_timeframe / snapshot_timeframe), so flipping
+# between them does not download anything.
+
+# CONFIG
+BARS_TTL = {'1h': 300, '1d': 3600}
+DEFAULT_BARS_TTL = 300
+# Set when `python iusa_scheduler.py` runs as its own worker process
+EXTERNAL_SCHEDULER = bool(os.environ.get('IUSA_EXTERNAL_SCHEDULER'))
+
+def bars_key(df):
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()).hexdigest()
+
+# bucket changes once per TTL, which gives each interval its own expiry
+@st.cache_data(show_spinner=False, max_entries=32)
+def _bars(ticker, interval, period, warmup, bucket):
+    return fetch_data(ticker, interval, period, warmup)
+
+def cached_bars(ticker, interval, period=None, warmup=0):
+    ttl = BARS_TTL.get(interval, DEFAULT_BARS_TTL)
+    return _bars(ticker, interval, period, warmup, int(time.time() // ttl))
+
+# _bars is not hashed by Streamlit; key already identifies its content
+@st.cache_data(show_spinner=False, max_entries=32)
+def _indicators(key, _bars, ticker, interval):
+    return add_indicators(_bars.copy(), ticker, interval)
+
+def cached_indicators(bars, ticker, interval):
+    return _indicators(bars_key(bars), bars, ticker, interval)
+
+# Bars of any timeframe in TIMEFRAMES, resampled from its cached base feed,
+# plus up to `warmup` bars before the period
+def cached_timeframe(ticker, timeframe, period=None, warmup=0):
+    base_interval = TIMEFRAME_BASES[timeframe]
+    base = cached_bars(ticker, base_interval, BASE_PERIODS[base_interval])
+    return window_bars(timeframe_bars(base, ticker, timeframe), period or TIMEFRAME_PERIODS[timeframe], warmup)
+
+# One refresh thread per Streamlit server process
+@st.cache_resource
+def background_scheduler():
+    if EXTERNAL_SCHEDULER:
+        return None
+    return RefreshScheduler().start()
+
+# (bars, age in seconds) from the local store. Only the very first run, before
+# anything is stored, waits for a download.
+def snapshot_bars(ticker, interval, period=None, warmup=0):
+    period = period or DEFAULT_PERIODS.get(interval, '60d')
+    bars, age = read_stored_bars(ticker, interval, period, warmup)
+    if bars is None:
+        return cached_bars(ticker, interval, period, warmup), 0.0
+    return bars, age
+
+# snapshot_bars() of the timeframe's base feed, resampled to `timeframe`
+def snapshot_timeframe(ticker, timeframe, period=None, warmup=0):
+    base_interval = TIMEFRAME_BASES[timeframe]
+    base, age = snapshot_bars(ticker, base_interval, BASE_PERIODS[base_interval])
+    return window_bars(timeframe_bars(base, ticker, timeframe), period or TIMEFRAME_PERIODS[timeframe], warmup), age
+
+# (news_score, trigger_count, missing_sources, age) from the latest snapshot;
+# neutral with age None until the first refresh has finished
+def snapshot_news():
+    snapshot = load_news_snapshot()
+    if snapshot is None:
+        return 0, 0, [], None
+    return snapshot['news_score'], snapshot['trigger_count'], snapshot['missing_sources'], snapshot['age']
+
+def clear_bars():
+    _bars.clear()
+    _indicators.clear()
+    iusa_timeframes.clear_cache()
+
+def clear_news():
+    iusa_news.clear_cache()
+
+# Sidebar buttons for manual refresh; with a scheduler the refresh runs in the
+# background and shows up on a later render
+def refresh_controls(scheduler=None):
+    st.sidebar.subheader('Refresh')
+    if st.sidebar.button('Refresh prices'):
+        clear_bars()
+        if scheduler is not None:
+            scheduler.refresh_now(news=False)
+    if st.sidebar.button('Refresh news'):
+        clear_news()
+        if scheduler is not None:
+            scheduler.refresh_now(bars=False)
+
+def format_age(seconds):
+    if seconds is None:
+        return 'pending'
+    if seconds < 60:
+        return f'{seconds:.0f}s ago'
+    if seconds < 3600:
+        return f'{seconds / 60:.0f} min ago'
+    return f'{seconds / 3600:.1f} h ago'
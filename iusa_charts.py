@@ -0,0 +1,212 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+# Chart layer for the dashboards. Each static chart keeps one Figure, its axes
+# and its line artists per (chart, size); a render only swaps the line data, so
+# ticks, legend and layout are not rebuilt and nothing is registered with pyplot
+# to accumulate on a long-lived server. The rendered PNG bytes are cached by a
+# hash of the plotted data, so an unchanged chart is not rasterized again.
+# The 'interactive' backend hands the series to the browser instead.
+# Candlesticks go through mplfinance, but only for the visible window and with
+# the moving averages the indicator stage already computed drawn as overlays;
+# the PNG is cached per (ticker, interval, last bar), so flipping between
+# intervals shows the cached candles of each.
+# Long series are thinned before plotting to about two points per horizontal
+# pixel, keeping each bucket's extremes (min/max) or its most visible point
+# (LTTB), so peaks and crossovers survive and render time stops growing with
+# history length.
+
+# CONFIG
+MAX_IMAGES = 64
+DPI = 100
+POINTS_PER_PIXEL = 2
+THIN_METHOD = 'minmax'  # 'minmax', 'lttb' or None
+PNG_COMPRESS_LEVEL = 1  # fast zlib level; line charts compress well anyway
+CANDLE_WINDOW = 90
+CANDLE_MAS = (('50_MA', 'tab:blue'), ('200_MA', 'tab:orange'))
+
+_figures = {}
+_images = OrderedDict()
+_lock = threading.Lock()
+
+def data_key(df, columns):
+    hashed = pd.util.hash_pandas_object(df[list(columns)], index=True).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
+
+# Positions of the min and max of each of n_out / 2 equal buckets, in order
+def minmax_indices(y, n_out):
+    n = len(y)
+    buckets = n_out // 2
+    if n <= n_out or buckets < 1:
+        return np.arange(n)
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    valid = offsets < n
+    lo = np.nanargmin(padded[valid], axis=1) + offsets[valid]
+    hi = np.nanargmax(padded[valid], axis=1) + offsets[valid]
+    return np.unique(np.concatenate([lo, hi, [0, n - 1]]))
+
+# Largest-Triangle-Three-Buckets: per bucket, the point forming the largest
+# triangle with the previous pick and the next bucket's average
+def lttb_indices(x, y, n_out):
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    picks = np.empty(n_out, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo = edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area)) if hi > lo else a
+        picks[i + 1] = a
+    return np.unique(picks)
+
+# Series thinned to at most about max_points (NaN warm-up rows dropped first)
+def thin(series, max_points, method=THIN_METHOD):
+    series = series.dropna()
+    if method is None or len(series) <= max_points:
+        return series
+    y = series.to_numpy(dtype=float)
+    if method == 'lttb':
+        x = series.index.asi8.astype(float) if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(y), dtype=float)
+        return series.iloc[lttb_indices(x, y, max_points)]
+    return series.iloc[minmax_indices(y, max_points)]
+
+# name -> (lines as (column, plot kwargs), horizontal guides as (y, color), figsize)
+CHARTS = {
+    'price': ([('Close', {'label': 'Price'}),
+               ('50_MA', {'label': '50 MA', 'linestyle': '--'}),
+               ('200_MA', {'label': '200 MA', 'linestyle': '--'})], [], (14, 6)),
+    'macd': ([('MACD', {'label': 'MACD'}),
+              ('Signal_Line', {'label': 'Signal Line'})], [], (14, 4)),
+    'rsi': ([('RSI', {'label': 'RSI', 'color': 'purple'})], [(70, 'red'), (30, 'green')], (14, 2)),
+}
+
+def chart_columns(name):
+    return [col for col, _ in CHARTS[name][0]]
+
+def _max_points(width_px):
+    return int(width_px * POINTS_PER_PIXEL)
+
+# Figure (with its own Agg canvas), axes and line artists for one chart, built once
+def _figure(name, dates):
+    lines_spec, guides, figsize = CHARTS[name]
+    key = (name, figsize, dates)
+    if key not in _figures:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize, dpi=DPI)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        if dates:
+            ax.xaxis_date()
+        lines = {col: ax.plot([], [], **kwargs)[0] for col, kwargs in lines_spec}
+        for y, color in guides:
+            ax.axhline(y, color=color, linestyle='--')
+        ax.legend(loc='upper left')
+        _figures[key] = (fig, ax, lines)
+    return _figures[key]
+
+def _x_values(index):
+    if isinstance(index, pd.DatetimeIndex):
+        from matplotlib.dates import date2num
+        return date2num(index.tz_localize(None) if index.tz is not None else index)
+    return np.asarray(index, dtype=float)
+
+# PNG bytes for one chart; redrawn only when the plotted data or title changes
+def render_png(name, df, title):
+    columns = chart_columns(name)
+    figsize = CHARTS[name][2]
+    key = (name, title, figsize, data_key(df, columns))
+    with _lock:
+        if key in _images:
+            _images.move_to_end(key)
+            return _images[key]
+        fig, ax, lines = _figure(name, isinstance(df.index, pd.DatetimeIndex))
+        # Thinned to the plot area's width in pixels, not the whole figure's
+        for col, line in lines.items():
+            series = thin(df[col], _max_points(ax.bbox.width), THIN_METHOD)
+            line.set_data(_x_values(series.index), series.to_numpy(dtype=float))
+        ax.relim()
+        ax.autoscale_view()
+        ax.set_title(title)
+        buf = io.BytesIO()
+        fig.canvas.print_png(buf, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        png = buf.getvalue()
+        _images[key] = png
+        while len(_images) > MAX_IMAGES:
+            _images.popitem(last=False)
+        return png
+
+def _candle_style(style):
+    import mplfinance as mpf
+    if isinstance(style, str):
+        return style
+    up, down = style
+    return mpf.make_mpf_style(marketcolors=mpf.make_marketcolors(up=up, down=down, inherit=True))
+
+# Candlestick PNG of the last `window` bars with volume and the precomputed MA
+# columns as overlays. style is an mplfinance style name or an (up, down) colour
+# pair. Keyed on the last bar (its values too, as a forming bar keeps its
+# timestamp), not on a hash of the whole frame.
+def render_candles(df, ticker, interval, window=CANDLE_WINDOW, style='yahoo'):
+    last = df.iloc[-1]
+    key = ('candles', ticker, interval, df.index[-1], tuple(last[['Open', 'High', 'Low', 'Close', 'Volume']]),
+           len(df), window, style)
+    with _lock:
+        if key in _images:
+            _images.move_to_end(key)
+            return _images[key]
+    import mplfinance as mpf
+    visible = df.iloc[-window:]
+    overlays = [mpf.make_addplot(visible[col], color=color, width=1)
+                for col, color in CANDLE_MAS if col in visible and visible[col].notna().any()]
+    buf = io.BytesIO()
+    mpf.plot(visible[['Open', 'High', 'Low', 'Close', 'Volume']], type='candle', volume=True,
+             style=_candle_style(style), addplot=overlays, show_nontrading=False,
+             savefig=dict(fname=buf, format='png', dpi=DPI, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL}))
+    png = buf.getvalue()
+    with _lock:
+        _images[key] = png
+        while len(_images) > MAX_IMAGES:
+            _images.popitem(last=False)
+    return png
+
+def show_candles(df, ticker, interval, window=CANDLE_WINDOW, style='yahoo'):
+    import streamlit as st
+    st.image(render_candles(df, ticker, interval, window, style), width='stretch')
+
+def clear_cache(figures=True):
+    with _lock:
+        _images.clear()
+        if figures:
+            _figures.clear()
+
+# Price / MACD / RSI charts as the dashboards show them
+def show_charts(df, label='IUSA', backend='static'):
+    import streamlit as st
+    titles = {'price': f'{label} Price with Moving Averages', 'macd': 'MACD Indicator', 'rsi': 'RSI Indicator'}
+    for name in CHARTS:
+        columns = chart_columns(name)
+        if backend == 'interactive':
+            # Rows that carry any column's bucket extremes, about 2 points per pixel of a wide chart
+            max_points = _max_points(CHARTS[name][2][0] * DPI)
+            keep = pd.Index([])
+            for col in columns:
+                keep = keep.union(thin(df[col], max_points, THIN_METHOD).index)
+            st.caption(titles[name])
+            st.line_chart(df.loc[keep, list(columns)])
+        else:
+            st.image(render_png(name, df, titles[name]), width='stretch')
@@ -1,129 +1,76 @@
-
-import yfinance as yf
-import pandas as pd
-import ta
-from datetime import datetime
-from textblob import TextBlob
-from bs4 import BeautifulSoup
-import requests
-import re
-import pytz
-import matplotlib.pyplot as plt
 import streamlit as st
-
-# CONFIG
-TICKER = 'IUSA.L'
-INTERVAL = '1h'
-TRIGGER_WORDS = ['recession', 'inflation', 'rate hike', 'crisis', 'strong earnings', 'bull market', 'bear market', 'volatility']
-NEWS_URLS = [
-    'https://www.bbc.com/news/business',
-    'https://www.reuters.com/business',
-    'https://www.cnbc.com/world/?region=world',
-    'https://finance.yahoo.com',
-    'https://www.ft.com/markets'
-]
-
-# Fetch Data
-def fetch_data(ticker=TICKER, interval=INTERVAL, period='60d'):
-    data = yf.download(ticker, period=period, interval=interval)
-    data.dropna(inplace=True)
-    return data
-
-# Add Indicators
-def add_indicators(df):
-    df['RSI'] = ta.momentum.RSIIndicator(close=df['Close'], window=14).rsi()
-    macd = ta.trend.MACD(close=df['Close'])
-    df['MACD'] = macd.macd()
-    df['Signal_Line'] = macd.macd_signal()
-    df['50_MA'] = df['Close'].rolling(window=50).mean()
-    df['200_MA'] = df['Close'].rolling(window=200).mean()
-    return df
-
-# Generate Technical Signal
-def generate_tech_signal(df):
-    latest = df.iloc[-1]
-    signal = 'Hold'
-    if latest['RSI'] < 30 and latest['MACD'] > latest['Signal_Line']:
-        signal = 'Buy'
-    elif latest['RSI'] > 70 and latest['MACD'] < latest['Signal_Line']:
-        signal = 'Sell'
-    elif latest['50_MA'] > latest['200_MA']:
-        signal = 'Buy (Momentum)'
-    return signal
-
-# News Sentiment Scraper
-def get_news_sentiment():
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    sentiment_score = 0
-    trigger_hits = 0
-    headlines_checked = 0
-    for url in NEWS_URLS:
-        try:
-            res = requests.get(url, headers=headers)
-            soup = BeautifulSoup(res.content, 'html.parser')
-            headlines = soup.find_all(['h1', 'h2', 'h3'])
-            for tag in headlines[:5]:
-                text = tag.get_text()
-                blob = TextBlob(text)
-                sentiment_score += blob.sentiment.polarity
-                headlines_checked += 1
-                if any(re.search(rf'\b{word}\b', text.lower()) for word in TRIGGER_WORDS):
-                    trigger_hits += 1
-        except Exception as e:
-            continue
-    if headlines_checked == 0:
-        return 0, 0
-    return sentiment_score / headlines_checked, trigger_hits
-
-# Final Decision
-def final_signal(tech_signal, news_score, trigger_count):
-    if tech_signal.startswith('Buy') and news_score > 0 and trigger_count == 0:
-        return 'BUY'
-    elif tech_signal == 'Sell' or news_score < -0.2 or trigger_count >= 2:
-        return 'SELL'
-    else:
-        return 'HOLD'
+from iusa_engine import TICKER, final_signal, generate_tech_signal, tech_signal_series
+from iusa_backtest import PERIODS_PER_YEAR, backtest
+from iusa_sentiment import sentiment_cache
+from iusa_signal_log import get_log, signal_changes
+from iusa_charts import show_charts
+from iusa_indicators import WARMUP_BARS
+from iusa_store import warmup_available, window_bars
+from iusa_timeframes import TIMEFRAME_PERIODS
+from iusa_cache import background_scheduler, cached_indicators, format_age, refresh_controls, snapshot_news, snapshot_timeframe
 
 # Streamlit Dashboard
 st.set_page_config(page_title='IUSA Signal Dashboard', layout='wide')
 st.title('IUSA Buy/Hold/Sell Signal')
 
-with st.spinner('Fetching data and calculating...'):
-    df = fetch_data()
-    df = add_indicators(df)
+INTERVAL_OPTIONS = {'Hourly': '1h', '4-Hourly': '4h', 'Daily': '1d', 'Weekly': '1wk'}
+INTERVAL = INTERVAL_OPTIONS[st.selectbox("Select Timeframe", list(INTERVAL_OPTIONS.keys()))]
+scheduler = background_scheduler()
+refresh_controls(scheduler)
+
+# Renders only read the latest snapshots; the scheduler refreshes them in the background.
+# Every timeframe is resampled from a stored feed (hourly for 1h/4h, daily for
+# 1d/1wk). Indicators are computed with warm-up bars before the window, which
+# are cut afterwards.
+with st.spinner('Loading latest snapshot...'):
+    period = TIMEFRAME_PERIODS[INTERVAL]
+    bars, bars_age = snapshot_timeframe(TICKER, INTERVAL, period, warmup=WARMUP_BARS)
+    warmup = warmup_available(bars, period)
+    df = window_bars(cached_indicators(bars, TICKER, INTERVAL), period)
     tech = generate_tech_signal(df)
-    news_score, triggers = get_news_sentiment()
+    news_score, triggers, missing_sources, news_age = snapshot_news()
     action = final_signal(tech, news_score, triggers)
     latest = df.iloc[-1]
+    signal_log = get_log(TICKER, INTERVAL)
+    # Before the first news refresh the score is only a neutral placeholder
+    if news_age is not None:
+        signal_log.append(df.index[-1], latest, tech, action, news_score, triggers)
 
+if warmup < WARMUP_BARS:
+    st.warning(f"Only {warmup} of {WARMUP_BARS} warm-up bars are stored before this window, so the "
+               "slower indicators (200-bar MA first) are missing or unsettled on its early bars.")
+st.caption(f"Prices updated {format_age(bars_age)} · News updated {format_age(news_age)}")
 st.metric("Current Price", f"£{latest['Close']:.2f}")
 st.metric("Signal", action)
 st.metric("News Score", f"{news_score:.2f}", help=">0 = Positive; <0 = Negative")
+if missing_sources:
+    st.caption("News sources missing (no answer in time): " + ", ".join(missing_sources))
+cache_stats = sentiment_cache.stats()
+st.caption(f"Sentiment cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses")
 
-# Plot Price and Indicators
-fig, ax = plt.subplots(figsize=(14, 6))
-ax.plot(df.index, df['Close'], label='Price')
-ax.plot(df.index, df['50_MA'], label='50 MA', linestyle='--')
-ax.plot(df.index, df['200_MA'], label='200 MA', linestyle='--')
-ax.set_title('IUSA Price with Moving Averages')
-ax.legend()
-st.pyplot(fig)
+# Price, MACD and RSI charts: cached PNGs, or drawn client-side in the browser
+chart_backend = st.radio("Charts", ["Static", "Interactive"], horizontal=True)
+show_charts(df, 'IUSA', backend='interactive' if chart_backend == 'Interactive' else 'static')
 
-# MACD Plot
-fig2, ax2 = plt.subplots(figsize=(14, 4))
-ax2.plot(df.index, df['MACD'], label='MACD')
-ax2.plot(df.index, df['Signal_Line'], label='Signal Line')
-ax2.set_title('MACD Indicator')
-ax2.legend()
-st.pyplot(fig2)
+# Logged signals, read back from the log rather than recomputed
+with st.expander("Signal history"):
+    history = signal_log.read(last=500)
+    st.caption(f"{len(signal_log)} snapshots logged for {TICKER} {INTERVAL}")
+    st.dataframe(signal_changes(history).iloc[::-1], width='stretch')
 
-# RSI Plot
-fig3, ax3 = plt.subplots(figsize=(14, 2))
-ax3.plot(df.index, df['RSI'], label='RSI', color='purple')
-ax3.axhline(70, color='red', linestyle='--')
-ax3.axhline(30, color='green', linestyle='--')
-ax3.set_title('RSI Indicator')
-ax3.legend()
-st.pyplot(fig3)
+# Backtest of the technical rules over the loaded history
+with st.expander("Backtest (technical signal)"):
+    position_size = st.slider("Position size", 0.1, 1.0, 1.0, 0.1)
+    fee_bps = st.slider("Fee (bps per trade)", 0.0, 50.0, 5.0, 0.5)
+    slippage_bps = st.slider("Slippage (bps per trade)", 0.0, 50.0, 2.0, 0.5)
+    bt = backtest(df['Close'], tech_signal_series(df), position_size, fee_bps, slippage_bps,
+                  periods_per_year=PERIODS_PER_YEAR.get(INTERVAL, 252))
+    stats = bt['stats']
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Return", f"{stats['total_return']:.1%}")
+    col2.metric("Max Drawdown", f"{stats['max_drawdown']:.1%}")
+    col3.metric("Hit Rate", "n/a" if stats['trades'] == 0 else f"{stats['hit_rate']:.0%}")
+    col4.metric("Trades", stats['trades'])
+    st.line_chart(bt['equity'])
 
 st.success("Dashboard updated successfully!")
@@ -1,20 +1,19 @@
 
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import numpy as np
-import mplfinance as mpf
 from ta.trend import MACD, SMAIndicator
 from ta.momentum import RSIIndicator
 from textblob import TextBlob
+from iusa_cache import cached_bars
+from iusa_charts import show_candles
 
 # Load data
 ticker = "IUSA.L"
 interval = "1d"
 period = "6mo"
 
-df = yf.download(ticker, period=period, interval=interval)
-df.dropna(inplace=True)
+df = cached_bars(ticker, interval, period).dropna()
 
 # Clean columns
 df.columns = [col.strip() for col in df.columns]
@@ -77,9 +76,7 @@ st.write(signal)
 
 # Candlestick chart
 st.subheader("Candlestick Chart")
-mc = mpf.make_marketcolors(up='g', down='r', inherit=True)
-s = mpf.make_mpf_style(marketcolors=mc)
-mpf.plot(df[-60:], type='candle', style=s, volume=True, mav=(50,200), show_nontrading=False)
+show_candles(df, ticker, interval, window=60, style=('g', 'r'))
 
 # News Sentiment (placeholder headlines)
 news_data = [
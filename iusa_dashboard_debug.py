@@ -1,5 +1,4 @@
 
-import yfinance as yf
 import pandas as pd
 import ta
 from datetime import datetime
@@ -10,6 +9,8 @@ import re
 import pytz
 import matplotlib.pyplot as plt
 import streamlit as st
+import iusa_engine
+from iusa_indicators import WARMUP_BARS
 
 # CONFIG
 TICKER = 'IUSA.L'
@@ -23,9 +24,10 @@ NEWS_URLS = [
     'https://www.ft.com/markets'
 ]
 
+# Includes the warm-up bars the indicators need, so the dropna in add_indicators
+# only cuts those and the full period is left
 def fetch_data(ticker=TICKER, interval=INTERVAL, period='60d'):
-    data = yf.download(ticker, period=period, interval=interval)
-    data.dropna(inplace=True)
+    data = iusa_engine.fetch_data(ticker, interval, period, warmup=WARMUP_BARS).dropna()
     if data.empty or 'Close' not in data.columns or data['Close'].dropna().empty:
         raise ValueError("Price data could not be loaded or is empty.")
     return data
@@ -1,11 +1,13 @@
 
 import streamlit as st
 import pandas as pd
-import yfinance as yf
 from ta import momentum, trend
-from textblob import TextBlob
-import requests
 from bs4 import BeautifulSoup
+from iusa_cache import cached_timeframe
+from iusa_indicators import WARMUP_BARS
+from iusa_news import fetch_headlines
+from iusa_sentiment import get_matcher, sentiment_cache
+from iusa_store import window_bars
 
 # --- CONFIG ---
 st.set_page_config(layout="wide")
@@ -25,14 +27,13 @@ mode = st.selectbox("Interval", options=["1d", "1h"], index=0)
 st.markdown("---")
 
 # --- LOAD DATA ---
-df = yf.download(TICKER, period="6mo", interval=mode)
-df = df.dropna()
+# 6 months plus the warm-up bars the indicators need; the warm-up is cut after computing
+df = cached_timeframe(TICKER, mode, "6mo", warmup=WARMUP_BARS).dropna()
 st.subheader("📊 Raw Data Snapshot")
 st.dataframe(df.tail(), use_container_width=True)
 
 # --- INDICATOR FALLBACK ---
 row_count = len(df)
-st.markdown(f"✅ Rows: {row_count}")
 available_indicators = []
 
 if row_count >= 14:
@@ -49,7 +50,9 @@ if row_count >= 50:
 if row_count >= 200:
     df['MA200'] = df['Close'].rolling(200).mean()
     available_indicators.append('200 MA')
+df = window_bars(df, "6mo")
 
+st.markdown(f"✅ Rows: {len(df)}")
 st.markdown(f"✅ With indicators: {len(available_indicators)} — {', '.join(available_indicators) if available_indicators else 'None'}")
 
 # --- NEWS SENTIMENT ---
@@ -58,21 +61,24 @@ sentiment_total = 0
 sentiment_count = 0
 
 def get_sentiment(text):
-    return TextBlob(text).sentiment.polarity
+    return sentiment_cache.polarity(text)
 
+def parse_links(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return [link.get_text(strip=True) for link in soup.find_all('a', href=True)]
+
+# Cached per source: flipping the interval does not re-download or re-parse
+trigger_matcher = get_matcher(TRIGGER_WORDS)
+titles_by_url, _ = fetch_headlines(list(NEWS_SOURCES.values()), 'a[href]', parse_links)
 for source, url in NEWS_SOURCES.items():
-    try:
-        html = requests.get(url, timeout=5).text
-        soup = BeautifulSoup(html, 'html.parser')
-        for link in soup.find_all('a', href=True):
-            title = link.get_text(strip=True)
-            if any(word in title.lower() for word in TRIGGER_WORDS):
-                score = get_sentiment(title)
-                sentiment_total += score
-                sentiment_count += 1
-                st.write(f"**{source}** — {title} ({round(score, 2)})")
-    except:
-        continue
+    for title in titles_by_url.get(url, []):
+        if trigger_matcher.matches(title):
+            score = get_sentiment(title)
+            sentiment_total += score
+            sentiment_count += 1
+            st.write(f"**{source}** — {title} ({round(score, 2)})")
+
+sentiment_cache.save()
 
 sentiment_score = sentiment_total / sentiment_count if sentiment_count else 0
 sentiment_label = "Positive" if sentiment_score > 0.2 else "Negative" if sentiment_score < -0.2 else "Neutral"
@@ -1,4 +1,3 @@
-import yfinance as yf
 import pandas as pd
 import ta
 from datetime import datetime
@@ -9,10 +8,14 @@ import re
 import pytz
 import matplotlib.pyplot as plt
 import streamlit as st
+import iusa_engine
+from iusa_indicators import WARMUP_BARS
+from iusa_store import window_bars
 
 # CONFIG
 TICKER = 'IUSA.L'
 INTERVAL = '1d'
+PERIOD = '1y'
 TRIGGER_WORDS = ['recession', 'inflation', 'rate hike', 'crisis', 'strong earnings', 'bull market', 'bear market', 'volatility']
 NEWS_URLS = [
     'https://www.bbc.com/news/business',
@@ -22,10 +25,9 @@ NEWS_URLS = [
     'https://www.ft.com/markets'
 ]
 
-def fetch_data(ticker=TICKER, interval=INTERVAL, period='1y'):
-    data = yf.download(ticker, period=period, interval=interval)
-    data.dropna(inplace=True)
-    return data
+# PERIOD plus the warm-up bars the indicators need; cut again after computing
+def fetch_data(ticker=TICKER, interval=INTERVAL, period=PERIOD):
+    return iusa_engine.fetch_data(ticker, interval, period, warmup=WARMUP_BARS).dropna()
 
 def add_indicators(df):
     df['Close'] = pd.to_numeric(df['Close'], errors='coerce')
@@ -91,8 +93,7 @@ try:
         st.write(df_raw.tail())
         st.text(f"✅ Raw data rows: {len(df_raw)}")
 
-        df = add_indicators(df_raw.copy())
-        df.dropna(subset=['RSI', 'MACD', 'Signal_Line'], inplace=True)
+        df = window_bars(add_indicators(df_raw.copy()), PERIOD)
 
         st.subheader("📈 Cleaned Data (with indicators)")
         st.write(df.tail())
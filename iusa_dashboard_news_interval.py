@@ -1,12 +1,12 @@
-import yfinance as yf
 import pandas as pd
 import ta
 import streamlit as st
 import matplotlib.pyplot as plt
-from textblob import TextBlob
-import requests
 from bs4 import BeautifulSoup
 import numpy as np
+from iusa_news import fetch_headlines
+from iusa_cache import cached_timeframe
+from iusa_sentiment import get_matcher, sentiment_cache
 
 st.set_page_config(page_title="IUSA AI Dashboard", layout="wide")
 st.title("📈 IUSA Buy/Hold/Sell Signal — News & Interval Aware")
@@ -26,10 +26,8 @@ NEWS_SOURCES = [
 ]
 
 def fetch_data():
-    df = yf.download(TICKER, period='60d', interval=INTERVAL)
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-    df.dropna(inplace=True)
+    # Resampled from the cached base feeds: flipping the timeframe downloads nothing
+    df = cached_timeframe(TICKER, INTERVAL, '60d').copy()
     if len(df.columns) == 6:
         df.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
     return df
@@ -54,24 +52,24 @@ def generate_signal(df, sentiment_score):
         return 'SELL'
     return 'HOLD'
 
+def parse_titles(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return [title.get_text(strip=True) for title in soup.find_all(['h2', 'h3'])]
+
 def fetch_news_sentiment():
     sentiment_score = 0
     headlines = []
 
-    for url in NEWS_SOURCES:
-        try:
-            page = requests.get(url, timeout=5)
-            soup = BeautifulSoup(page.text, 'html.parser')
-            titles = soup.find_all(['h2', 'h3'])
-
-            for title in titles:
-                text = title.get_text(strip=True)
-                if any(word in text.lower() for word in TRIGGER_WORDS):
-                    headlines.append(text)
-                    sentiment_score += TextBlob(text).sentiment.polarity
-        except Exception:
-            continue
+    trigger_matcher = get_matcher(TRIGGER_WORDS)
+    # Cached per source: flipping the interval does not re-download or re-parse
+    titles_by_source, _ = fetch_headlines(NEWS_SOURCES, 'h2-h3', parse_titles)
+    for titles in titles_by_source.values():
+        for text in titles:
+            if trigger_matcher.matches(text):
+                headlines.append(text)
+                sentiment_score += sentiment_cache.polarity(text)
 
+    sentiment_cache.save()
     sentiment_label = "Positive" if sentiment_score > 0.2 else "Negative" if sentiment_score < -0.2 else "Neutral"
     return sentiment_score, sentiment_label, headlines[:5]
 
@@ -0,0 +1,41 @@
+import streamlit as st
+from iusa_cache import snapshot_news
+from iusa_engine import TICKER
+from iusa_stream import ReplayFeed, SignalStream
+
+st.set_page_config(page_title='IUSA Signal Dashboard (Streaming)', layout='wide')
+st.title('📡 IUSA Buy/Hold/Sell Signal — Streaming Mode')
+
+interval = st.selectbox("Interval", ["1h", "1d"], index=0)
+pace = st.slider("Replay pace (seconds per bar)", 0.0, 1.0, 0.05, 0.05)
+
+news_score, triggers, _, _ = snapshot_news()
+st.caption(f"News score {news_score:.2f}, {triggers} trigger headlines (latest snapshot)")
+
+# One placeholder per value; a bar only redraws the values it changed
+col1, col2, col3, col4 = st.columns(4)
+FIELDS = {
+    'Close': (col1.empty(), "Current Price", lambda v: f"£{v:.2f}"),
+    'RSI': (col2.empty(), "RSI", lambda v: f"{v:.1f}"),
+    'tech_signal': (col3.empty(), "Technical", str),
+    'signal': (col4.empty(), "Signal", str),
+}
+bar_time = st.empty()
+latency = st.empty()
+
+if st.button("Start replay"):
+    try:
+        feed = ReplayFeed(TICKER, interval, pace=pace)
+    except ValueError as e:
+        st.warning(f"⚠️ {e}")
+    else:
+        stream = SignalStream(news_score, triggers)
+        for changed in stream.run(feed):
+            for key, (box, label, fmt) in FIELDS.items():
+                if key in changed and changed[key] == changed[key]:
+                    box.metric(label, fmt(changed[key]))
+            bar_time.text(f"Bar closed: {changed['timestamp']}")
+            stats = stream.latency_stats()
+            latency.caption(f"Update latency: last {stats['last_ms']:.3f} ms · "
+                            f"mean {stats['mean_ms']:.3f} ms · p95 {stats['p95_ms']:.3f} ms")
+        st.success("✅ Replay finished")
@@ -1,11 +1,11 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import mplfinance as mpf
 import ta
 import datetime
+from iusa_cache import cached_timeframe
+from iusa_charts import show_candles
 
 st.set_page_config(layout="wide")
 st.title("📈 IUSA Buy/Hold/Sell Signal — Zacks & Candlestick Upgrade")
@@ -15,9 +15,8 @@ INTERVAL = st.selectbox("Interval", ["1d", "1h"], index=0)
 PERIOD = "6mo" if INTERVAL == "1d" else "30d"
 
 # --- Fetch Data ---
-df = yf.download(TICKER, period=PERIOD, interval=INTERVAL)
-df.dropna(inplace=True)
-df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+df = cached_timeframe(TICKER, INTERVAL, PERIOD).dropna()
+df = df[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
 df.index.name = "Date"
 
 # --- Indicators ---
@@ -48,9 +47,7 @@ st.markdown(f"**Zacks Rank**: {zacks_rating}")
 
 # --- Candlestick Chart ---
 st.subheader("📊 Candlestick Chart with MAs")
-plot_df = df[-90:] if len(df) > 90 else df
-mpf_fig = mpf.plot(plot_df, type='candle', mav=(50,200), volume=True, style='yahoo', returnfig=True)
-st.pyplot(mpf_fig[0])
+show_candles(df, TICKER, INTERVAL, window=90, style='yahoo')
 
 # --- Candlestick Pattern Detection (basic) ---
 def detect_pattern(df):
@@ -0,0 +1,149 @@
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from iusa_store import update_bars, warmup_period, window_bars
+from iusa_indicators import WARMUP_BARS, get_engine
+from iusa_news import fetch_headlines
+from iusa_sentiment import sentiment_cache
+from iusa_signal_log import get_log
+
+# Headless signal engine: no Streamlit, usable from the dashboard, cron jobs and benchmarks.
+
+# CONFIG
+TICKER = 'IUSA.L'
+INTERVAL = '1h'
+DEFAULT_PERIODS = {'1h': '60d', '1d': '1y'}
+TRIGGER_WORDS = ['recession', 'inflation', 'rate hike', 'crisis', 'strong earnings', 'bull market', 'bear market', 'volatility']
+NEWS_URLS = [
+    'https://www.bbc.com/news/business',
+    'https://www.reuters.com/business',
+    'https://www.cnbc.com/world/?region=world',
+    'https://finance.yahoo.com',
+    'https://www.ft.com/markets'
+]
+
+# Fetch Data (local bar store first, then only the bars after the last stored one).
+# With warmup, `warmup` extra bars before the period are included (downloaded
+# only if the store does not have them) so indicators are valid from the
+# period's first bar; cut them with window_bars(df, period) after computing.
+def fetch_data(ticker=TICKER, interval=INTERVAL, period=None, warmup=0):
+    period = period or DEFAULT_PERIODS.get(interval, '60d')
+    if not warmup:
+        return update_bars(ticker, interval, period)
+    return window_bars(update_bars(ticker, interval, warmup_period(period, interval, warmup)), period, warmup)
+
+# Add Indicators (incremental: only bars after the last seen one are computed)
+def add_indicators(df, ticker=TICKER, interval=INTERVAL):
+    indicators = get_engine(ticker, interval).extend(df)
+    for col in indicators.columns:
+        df[col] = indicators[col]
+    return df
+
+# Generate Technical Signal
+def generate_tech_signal(df):
+    return tech_signal_for(df.iloc[-1])
+
+# Same rules on a single bar (row, Series or dict of indicator values)
+def tech_signal_for(latest):
+    signal = 'Hold'
+    if latest['RSI'] < 30 and latest['MACD'] > latest['Signal_Line']:
+        signal = 'Buy'
+    elif latest['RSI'] > 70 and latest['MACD'] < latest['Signal_Line']:
+        signal = 'Sell'
+    elif latest['50_MA'] > latest['200_MA']:
+        signal = 'Buy (Momentum)'
+    return signal
+
+# generate_tech_signal() for every bar at once, with boolean masks in the same
+# priority order as the scalar branches. Thresholds and MA columns can be swapped
+# for parameter sweeps.
+def tech_signal_series(df, rsi_low=30, rsi_high=70, fast_ma='50_MA', slow_ma='200_MA'):
+    conditions = [
+        (df['RSI'] < rsi_low) & (df['MACD'] > df['Signal_Line']),
+        (df['RSI'] > rsi_high) & (df['MACD'] < df['Signal_Line']),
+        df[fast_ma] > df[slow_ma],
+    ]
+    return pd.Series(np.select(conditions, ['Buy', 'Sell', 'Buy (Momentum)'], 'Hold'), index=df.index)
+
+# Top headlines of a news page
+def parse_headlines(content):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    return [tag.get_text() for tag in soup.find_all(['h1', 'h2', 'h3'])[:5]]
+
+# News Sentiment Scraper (sources fetched concurrently; pages, headlines and scores cached)
+def get_news_sentiment(urls=NEWS_URLS, trigger_words=TRIGGER_WORDS):
+    sentiment_score = 0
+    trigger_hits = 0
+    headlines_checked = 0
+    headlines, missing = fetch_headlines(urls, 'h1-h3 top5', parse_headlines)
+    for texts in headlines.values():
+        for text in texts:
+            polarity, found = sentiment_cache.analyze(text, trigger_words)
+            sentiment_score += polarity
+            headlines_checked += 1
+            if found:
+                trigger_hits += 1
+    sentiment_cache.save()
+    if headlines_checked == 0:
+        return 0, 0, missing
+    return sentiment_score / headlines_checked, trigger_hits, missing
+
+# Final Decision
+def final_signal(tech_signal, news_score, trigger_count):
+    if tech_signal.startswith('Buy') and news_score > 0 and trigger_count == 0:
+        return 'BUY'
+    elif tech_signal == 'Sell' or news_score < -0.2 or trigger_count >= 2:
+        return 'SELL'
+    else:
+        return 'HOLD'
+
+# final_signal() for every bar; news_score and trigger_count may be series
+# aligned with tech_signals or plain numbers
+def final_signal_series(tech_signals, news_score, trigger_count):
+    tech = tech_signals.astype(str)
+    buy = tech.str.startswith('Buy') & (news_score > 0) & (trigger_count == 0)
+    sell = (tech == 'Sell') | (news_score < -0.2) | (trigger_count >= 2)
+    return pd.Series(np.select([buy, sell], ['BUY', 'SELL'], 'HOLD'), index=tech_signals.index)
+
+# Full pipeline for one ticker. With news=False no website is contacted and the
+# news inputs count as neutral. With log=True the result goes to the signal log.
+def compute_signal(ticker=TICKER, interval=INTERVAL, period=None, news=True, log=False):
+    period = period or DEFAULT_PERIODS.get(interval, '60d')
+    df = add_indicators(fetch_data(ticker, interval, period, WARMUP_BARS), ticker, interval)
+    df = window_bars(df, period)
+    tech = generate_tech_signal(df)
+    news_score, triggers, missing = get_news_sentiment() if news else (0, 0, [])
+    latest = df.iloc[-1]
+    signal = final_signal(tech, news_score, triggers)
+    if log:
+        get_log(ticker, interval).append(df.index[-1], latest, tech, signal, news_score, triggers)
+    return {
+        'ticker': ticker,
+        'interval': interval,
+        'timestamp': df.index[-1],
+        'price': float(latest['Close']),
+        'tech_signal': tech,
+        'news_score': news_score,
+        'trigger_count': triggers,
+        'missing_sources': missing,
+        'signal': signal,
+        'data': df,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute the IUSA buy/hold/sell signal without Streamlit.')
+    parser.add_argument('ticker', nargs='?', default=TICKER)
+    parser.add_argument('--interval', default=INTERVAL)
+    parser.add_argument('--period', default=None)
+    parser.add_argument('--no-news', action='store_true', help='skip scraping news sources')
+    parser.add_argument('--log', action='store_true', help='append the result to the signal log')
+    args = parser.parse_args(argv)
+    result = compute_signal(args.ticker, args.interval, args.period, news=not args.no_news, log=args.log)
+    result.pop('data')
+    result['timestamp'] = str(result['timestamp'])
+    print(json.dumps(result, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+import argparse
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Typed loader for signal exports like iusa_enriched_data.csv
+# (Date, Close, 50_MA, 200_MA, RSI, MACD, MACD_Signal, Signal[, Ticker]).
+# The CSV is parsed with an explicit schema, never by inference: Date becomes a
+# datetime64 index, prices and indicators float64 (indicators optionally
+# float32), and Signal / Ticker categoricals. On first read the CSV is streamed
+# chunk by chunk into a columnar cache (one raw file per column plus meta.json,
+# as in iusa_archive); later reads memory-map only the columns asked for. The
+# cache is rebuilt when the CSV's size or mtime changes.
+
+# CONFIG
+CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'iusa_enriched_data.csv')
+CACHE_DIR = os.environ.get('IUSA_COLUMNAR_CACHE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.columnar_cache'))
+INDEX_COLUMN = 'Date'
+PRICE_COLUMNS = ('Close',)
+INDICATOR_COLUMNS = ('50_MA', '200_MA', 'RSI', 'MACD', 'MACD_Signal')
+# Categorical columns and the categories known up front; others found in the
+# data are added as they appear
+CATEGORIES = {'Signal': ['BUY', 'HOLD', 'SELL'], 'Ticker': []}
+CHUNK_ROWS = 250_000
+INDEX_DTYPE = np.dtype('<i8')
+VALUE_DTYPE = np.dtype('<f8')
+CODE_DTYPE = np.dtype('<i2')
+
+# One directory per source file: its name plus a hash of its absolute path, so
+# same-named exports from different directories never share a cache
+def cache_path(path, root=None):
+    path = os.path.abspath(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(path.encode()).hexdigest()[:12]
+    return os.path.join(root or CACHE_DIR, f'{name}-{digest}')
+
+def _float_dtype(column, float32):
+    return np.float32 if float32 and column in INDICATOR_COLUMNS else np.float64
+
+def _header(path):
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def _read_chunks(path, chunksize, float32=False, usecols=None):
+    header = _header(path)
+    usecols = [c for c in header if usecols is None or c == INDEX_COLUMN or c in usecols]
+    dtype = {c: _float_dtype(c, float32) for c in usecols if c in PRICE_COLUMNS + INDICATOR_COLUMNS}
+    dtype.update({c: 'category' for c in usecols if c in CATEGORIES})
+    dtype[INDEX_COLUMN] = str
+    return pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+
+# Chunk column -> categorical on `known`, extending `known` with new labels
+def _categorical(values, known):
+    known.extend(sorted(set(values.cat.categories) - set(known)))
+    return values.cat.set_categories(known)
+
+def _parse_index(dates):
+    return pd.DatetimeIndex(pd.to_datetime(dates, format='ISO8601'), name=INDEX_COLUMN)
+
+# Typed chunks straight from the CSV, without touching the cache. Categories
+# grow across chunks, so each chunk's are a prefix of the next one's.
+def iter_csv(path=CSV_PATH, chunksize=CHUNK_ROWS, float32=False, columns=None):
+    categories = {c: list(known) for c, known in CATEGORIES.items()}
+    for chunk in _read_chunks(path, chunksize, float32, columns):
+        index = _parse_index(chunk.pop(INDEX_COLUMN))
+        for column in chunk.columns:
+            if column in categories:
+                chunk[column] = _categorical(chunk[column], categories[column])
+        chunk.index = index
+        yield chunk
+
+# The whole CSV as one typed frame. The last chunk's categories hold every
+# earlier chunk's, so all chunks take them on before concatenating (pd.concat
+# falls back to plain strings when categories differ).
+def read_csv_typed(path=CSV_PATH, float32=False, columns=None, chunksize=CHUNK_ROWS):
+    chunks = list(iter_csv(path, chunksize, float32, columns))
+    for chunk in chunks[:-1]:
+        for column in chunk.columns:
+            if column in CATEGORIES:
+                chunk[column] = chunk[column].cat.set_categories(chunks[-1][column].cat.categories)
+    return pd.concat(chunks)
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _column_file(cache, column):
+    if column is None:
+        return os.path.join(cache, 'index.i8')
+    return os.path.join(cache, f'{column}.c2' if column in CATEGORIES else f'{column}.f8')
+
+def read_meta(path=CSV_PATH, root=None):
+    meta_path = os.path.join(cache_path(path, root), 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return meta if meta['source'] == _source_stamp(path) else None
+
+# Stream the CSV into the columnar cache; memory stays at about one chunk
+def build_cache(path=CSV_PATH, root=None, chunksize=CHUNK_ROWS):
+    cache = cache_path(path, root)
+    os.makedirs(cache, exist_ok=True)
+    meta_path = os.path.join(cache, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    source = _source_stamp(path)
+    columns = [c for c in _header(path) if c != INDEX_COLUMN]
+    categories = {c: list(CATEGORIES[c]) for c in columns if c in CATEGORIES}
+    files = {c: open(_column_file(cache, c), 'wb') for c in [None] + columns}
+    length, last, ordered, tz = 0, None, True, None
+    try:
+        for chunk in _read_chunks(path, chunksize):
+            index = _parse_index(chunk.pop(INDEX_COLUMN))
+            if index.tz is not None:
+                tz = str(index.tz)
+                index = index.tz_convert(None)
+            stamps = index.as_unit('ns').asi8
+            if len(stamps):
+                ordered = ordered and (last is None or stamps[0] >= last) and bool(np.all(np.diff(stamps) >= 0))
+                last = int(stamps[-1])
+            files[None].write(stamps.astype(INDEX_DTYPE).tobytes())
+            for column in columns:
+                if column in categories:
+                    codes = _categorical(chunk[column], categories[column]).cat.codes.to_numpy()
+                    files[column].write(codes.astype(CODE_DTYPE).tobytes())
+                else:
+                    values = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=VALUE_DTYPE)
+                    files[column].write(values.tobytes())
+            length += len(chunk)
+    finally:
+        for f in files.values():
+            f.close()
+    meta = {'source': source, 'columns': columns, 'categories': categories, 'length': length,
+            'ordered': ordered, 'tz': tz}
+    # meta.json is written last; without it the cache counts as missing
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+    return meta
+
+def _cached_meta(path, root):
+    return read_meta(path, root) or build_cache(path, root)
+
+def _map(cache, column, dtype, length):
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(_column_file(cache, column), dtype=dtype, mode='r', shape=(length,))
+
+def _frame(cache, meta, columns, lo, hi, float32):
+    index = pd.DatetimeIndex(_map(cache, None, INDEX_DTYPE, meta['length'])[lo:hi].view('datetime64[ns]'),
+                             name=INDEX_COLUMN)
+    if meta['tz']:
+        index = index.tz_localize('UTC').tz_convert(meta['tz'])
+    data = {}
+    for column in columns or meta['columns']:
+        if column in meta['categories']:
+            codes = _map(cache, column, CODE_DTYPE, meta['length'])[lo:hi]
+            data[column] = pd.Categorical.from_codes(codes, categories=meta['categories'][column])
+        else:
+            values = _map(cache, column, VALUE_DTYPE, meta['length'])[lo:hi]
+            dtype = _float_dtype(column, float32)
+            data[column] = values.astype(dtype) if dtype != VALUE_DTYPE else values
+    return pd.DataFrame(data, index=index, copy=False)
+
+def _bounds(cache, meta, start, end):
+    if start is None and end is None:
+        return 0, meta['length']
+    if not meta['ordered']:
+        raise ValueError('start / end need a file sorted by Date')
+    stamps = _map(cache, None, INDEX_DTYPE, meta['length'])
+    def utc_ns(value):
+        value = pd.Timestamp(value)
+        if value.tz is not None:
+            value = value.tz_convert(None)
+        return value.as_unit('ns').value
+    lo = 0 if start is None else int(np.searchsorted(stamps, utc_ns(start), 'left'))
+    hi = meta['length'] if end is None else int(np.searchsorted(stamps, utc_ns(end), 'right'))
+    return lo, hi
+
+# Whole export (or [start, end]) as a typed DataFrame over the columnar cache,
+# building the cache on first read. Only the requested columns are mapped.
+def load_enriched(path=CSV_PATH, columns=None, float32=False, start=None, end=None, root=None):
+    meta = _cached_meta(path, root)
+    cache = cache_path(path, root)
+    lo, hi = _bounds(cache, meta, start, end)
+    return _frame(cache, meta, columns, lo, hi, float32)
+
+# Same data in chunks of `chunksize` rows, read from the cache
+def iter_enriched(path=CSV_PATH, chunksize=CHUNK_ROWS, columns=None, float32=False, root=None):
+    meta = _cached_meta(path, root)
+    cache = cache_path(path, root)
+    for lo in range(0, meta['length'], chunksize):
+        yield _frame(cache, meta, columns, lo, min(lo + chunksize, meta['length']), float32)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build (or rebuild) the columnar cache of a signal export CSV.')
+    parser.add_argument('csv', nargs='?', default=CSV_PATH)
+    args = parser.parse_args(argv)
+    meta = build_cache(args.csv)
+    print(f"{meta['length']} rows, columns {', '.join(meta['columns'])} -> {cache_path(args.csv)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+from collections import deque
+import numpy as np
+import pandas as pd
+import iusa_kernels as kernels
+
+# CONFIG
+RSI_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+MA_WINDOWS = (50, 200)
+
+# Bars needed before the first bar on which every indicator has a value
+# (ta's min_periods): RSI window, MACD slow + signal, longest MA
+def warmup_bars(rsi_window=RSI_WINDOW, macd_slow=MACD_SLOW, macd_signal=MACD_SIGNAL, ma_windows=MA_WINDOWS):
+    return max(rsi_window, macd_slow + macd_signal - 1, *ma_windows) - 1
+
+WARMUP_BARS = warmup_bars()
+
+# Stateful RSI / MACD / SMA engine. Keeps Wilder averages, the MACD EMAs and
+# rolling-sum windows so appending N bars costs O(N), not O(history). Batches
+# of bars go through the array kernels in iusa_kernels, continuing from that
+# state; single bars go through _step().
+# Matches ta.momentum.RSIIndicator and ta.trend.MACD (fillna=False).
+class IndicatorEngine:
+    def __init__(self, rsi_window=RSI_WINDOW, macd_fast=MACD_FAST, macd_slow=MACD_SLOW,
+                 macd_signal=MACD_SIGNAL, ma_windows=MA_WINDOWS):
+        self.rsi_window = rsi_window
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal = macd_signal
+        self.ma_windows = tuple(ma_windows)
+        self.columns = ['RSI', 'MACD', 'Signal_Line'] + [f'{w}_MA' for w in self.ma_windows]
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.last_close = None
+        self.avg_up = 0.0
+        self.avg_down = 0.0
+        self.ema_fast = 0.0
+        self.ema_slow = 0.0
+        self.ema_signal = 0.0
+        self.signal_count = 0
+        self.ma_values = {w: deque() for w in self.ma_windows}
+        self.ma_sums = {w: 0.0 for w in self.ma_windows}
+        self.history = pd.DataFrame(columns=self.columns, dtype=float)
+        self._provisional = None
+
+    def _state(self):
+        return (self.count, self.last_close, self.avg_up, self.avg_down, self.ema_fast, self.ema_slow,
+                self.ema_signal, self.signal_count,
+                {w: deque(v) for w, v in self.ma_values.items()}, dict(self.ma_sums))
+
+    def _restore(self, state):
+        (self.count, self.last_close, self.avg_up, self.avg_down, self.ema_fast, self.ema_slow,
+         self.ema_signal, self.signal_count, self.ma_values, self.ma_sums) = state
+
+    def _step(self, close):
+        self.count += 1
+        first = self.last_close is None
+        change = 0.0 if first else close - self.last_close
+        self.last_close = close
+
+        # Wilder RSI: ewm(alpha=1/window, adjust=False), seeded with a zero move
+        up, down = max(change, 0.0), max(-change, 0.0)
+        alpha = 1.0 / self.rsi_window
+        if first:
+            self.avg_up, self.avg_down = up, down
+        else:
+            self.avg_up += alpha * (up - self.avg_up)
+            self.avg_down += alpha * (down - self.avg_down)
+        rsi = np.nan
+        if self.count >= self.rsi_window:
+            rsi = 100.0 if self.avg_down == 0 else 100.0 - 100.0 / (1.0 + self.avg_up / self.avg_down)
+
+        # MACD: ewm(span, adjust=False) on close, signal EMA starts at the first valid MACD
+        if first:
+            self.ema_fast = self.ema_slow = close
+        else:
+            self.ema_fast += 2.0 / (self.macd_fast + 1) * (close - self.ema_fast)
+            self.ema_slow += 2.0 / (self.macd_slow + 1) * (close - self.ema_slow)
+        macd = signal = np.nan
+        if self.count >= max(self.macd_fast, self.macd_slow):
+            macd = self.ema_fast - self.ema_slow
+            self.signal_count += 1
+            if self.signal_count == 1:
+                self.ema_signal = macd
+            else:
+                self.ema_signal += 2.0 / (self.macd_signal + 1) * (macd - self.ema_signal)
+            if self.signal_count >= self.macd_signal:
+                signal = self.ema_signal
+
+        row = [rsi, macd, signal]
+        for w in self.ma_windows:
+            values = self.ma_values[w]
+            values.append(close)
+            self.ma_sums[w] += close
+            if len(values) > w:
+                self.ma_sums[w] -= values.popleft()
+            # Re-sum once per window so the running sum cannot drift
+            if self.count % w == 0:
+                self.ma_sums[w] = sum(values)
+            row.append(self.ma_sums[w] / w if len(values) == w else np.nan)
+        return row
+
+    # Same result and end state as calling _step() on every value, as arrays
+    def _bulk(self, values):
+        n = len(values)
+        counts = self.count + np.arange(1, n + 1)
+        first = self.last_close is None
+        rows = np.empty((n, len(self.columns)))
+
+        change = np.empty(n)
+        change[0] = 0.0 if first else values[0] - self.last_close
+        np.subtract(values[1:], values[:-1], out=change[1:])
+        alpha = 1.0 / self.rsi_window
+        avg_up = kernels.ema(np.maximum(change, 0.0), alpha, start=np.nan if first else self.avg_up)
+        avg_down = kernels.ema(np.maximum(-change, 0.0), alpha, start=np.nan if first else self.avg_down)
+        rsi = kernels.rsi_from_averages(avg_up, avg_down, rows[:, 0])
+        rsi[counts < self.rsi_window] = np.nan
+
+        ema_fast = kernels.ema(values, kernels.span_alpha(self.macd_fast), start=np.nan if first else self.ema_fast)
+        ema_slow = kernels.ema(values, kernels.span_alpha(self.macd_slow), start=np.nan if first else self.ema_slow)
+        macd, signal = rows[:, 1], rows[:, 2]
+        np.subtract(ema_fast, ema_slow, out=macd)
+        valid = int(np.searchsorted(counts, max(self.macd_fast, self.macd_slow)))
+        macd[:valid] = np.nan
+        signal[:valid] = np.nan
+        if valid < n:
+            kernels.ema(macd[valid:], kernels.span_alpha(self.macd_signal), out=signal[valid:],
+                        start=self.ema_signal if self.signal_count else np.nan)
+            self.ema_signal = float(signal[-1])
+            signal_counts = self.signal_count + np.arange(1, n - valid + 1)
+            signal[valid:][signal_counts < self.macd_signal] = np.nan
+            self.signal_count += n - valid
+
+        for i, w in enumerate(self.ma_windows, start=3):
+            window = np.concatenate([np.fromiter(self.ma_values[w], dtype=float, count=len(self.ma_values[w])), values])
+            rows[:, i] = kernels.sma(window, w)[-n:]
+            self.ma_values[w] = deque(window[-w:].tolist())
+            self.ma_sums[w] = sum(self.ma_values[w])
+
+        self.count += n
+        self.last_close = float(values[-1])
+        self.avg_up, self.avg_down = float(avg_up[-1]), float(avg_down[-1])
+        self.ema_fast, self.ema_slow = float(ema_fast[-1]), float(ema_slow[-1])
+        return rows
+
+    # Streaming path: one closed bar in, {column: value} out. Does not keep the
+    # history frame, so an engine fed this way should not also use extend().
+    def push(self, close):
+        return dict(zip(self.columns, self._step(float(close))))
+
+    # Feed closes that come after everything already seen. The last bar is kept
+    # provisional so a still-forming bar can be replaced on the next call.
+    def update(self, close):
+        values = close.to_numpy(dtype=float)
+        rows = np.empty((len(values), len(self.columns)))
+        if len(values):
+            if len(values) > 1:
+                rows[:-1] = self._bulk(values[:-1])
+            self._provisional = self._state()
+            rows[-1] = self._step(values[-1])
+        new = pd.DataFrame(rows, index=close.index, columns=self.columns)
+        self.history = new if self.history.empty else pd.concat([self.history, new])
+        return new
+
+    # Indicators for every row of df, only computing rows after the last one seen.
+    # df may start later than the bars already seen (a moving period window); the
+    # earlier bars then just act as extra warm-up.
+    def extend(self, df):
+        close = df['Close']
+        history = self.history
+        incremental = False
+        if not history.empty and self._provisional is not None \
+                and close.index[0] in history.index and history.index[-1] in close.index:
+            start = history.index.get_loc(close.index[0])
+            end = close.index.get_loc(history.index[-1])
+            incremental = end == len(history) - 1 - start
+        if incremental:
+            self._restore(self._provisional)
+            self.history = history.iloc[start:-1]
+            self.update(close.iloc[end:])
+        else:
+            self.reset()
+            self.update(close)
+        return self.history.reindex(df.index)
+
+_engines = {}
+
+def get_engine(ticker, interval):
+    key = (ticker, interval)
+    if key not in _engines:
+        _engines[key] = IndicatorEngine()
+    return _engines[key]
@@ -0,0 +1,206 @@
+import os
+from importlib.util import find_spec
+import numpy as np
+
+# Indicator kernels over contiguous 1-D float64 arrays: EMA, SMA, RSI, MACD and
+# its signal line, with the same values as ta (fillna=False) and pandas ewm /
+# rolling. Every kernel takes an optional `out` buffer of the input's length and
+# writes into it, so callers can reuse preallocated arrays. The recurrences run
+# as numba-compiled loops when numba is installed (imported and compiled on
+# first use, so it does not slow down start-up), otherwise as blocked NumPy:
+# each block is solved in closed form with a cumsum, and only the carry between
+# blocks is a Python loop.
+# Missing values (NaN) follow one rule on both backends: an EMA skips them and
+# holds its value through the gap (ewm(adjust=False, ignore_na=True)), and an
+# SMA is NaN for every window that holds one (rolling().mean()). Infinite
+# values are rejected.
+
+# CONFIG
+BACKENDS = ['numpy'] + (['numba'] if find_spec('numba') is not None else [])
+BACKEND = 'numpy' if os.environ.get('IUSA_NO_JIT') else BACKENDS[-1]
+MAX_GROWTH = 1e3  # largest d**-j inside a NumPy EMA block; bounds the cumsum rounding error
+
+def as_array(x):
+    a = np.ascontiguousarray(x, dtype=np.float64)
+    if a.ndim == 2 and a.shape[1] == 1:
+        a = a[:, 0]
+    if a.ndim != 1:
+        raise ValueError(f'expected a 1-D series of values, got shape {a.shape}')
+    # One sum is cheaper than a mask; it only comes out non-finite on NaN or inf
+    if not np.isfinite(a.sum()) and np.isinf(a).any():
+        raise ValueError('values must be finite or NaN')
+    return a
+
+def _out(out, n):
+    if out is None:
+        return np.empty(n, dtype=np.float64)
+    if out.shape != (n,) or out.dtype != np.float64:
+        raise ValueError(f'out must be float64 of shape ({n},), got {out.dtype} {out.shape}')
+    return out
+
+def span_alpha(span):
+    return 2.0 / (span + 1)
+
+# --- NumPy cores ---
+
+# y[t] = y[t-1] + alpha * (x[t] - y[t-1]), starting from `start` (or x[0] if NaN)
+def _ema_numpy(x, alpha, out, start):
+    if len(x) == 0:
+        return out
+    if np.isnan(x.sum()):
+        valid = ~np.isnan(x)
+        # Run over the values alone, then hold each result through the gap after it
+        compact = _ema_numpy(x[valid], alpha, np.empty(int(valid.sum())), start)
+        last = np.cumsum(valid) - 1
+        out[:] = np.where(last >= 0, compact[np.maximum(last, 0)] if len(compact) else start, start)
+        return out
+    if np.isnan(start):
+        out[0] = start = x[0]
+        x, body = x[1:], out[1:]
+    else:
+        body = out
+    d = 1.0 - alpha
+    if d <= 0.0 or len(x) == 0:
+        body[:] = x
+        return out
+    size = int(np.clip(np.log(MAX_GROWTH) / -np.log(d), 1, 256))
+    blocks = -(-len(x) // size)
+    local = np.zeros(blocks * size)
+    local[:len(x)] = x
+    local = local.reshape(blocks, size)
+    j = np.arange(size)
+    # Block-local EMA from zero: alpha * d**j * cumsum(x[k] * d**-k)
+    local *= d ** -j
+    np.cumsum(local, axis=1, out=local)
+    local *= alpha * d ** j
+    carries = np.empty(blocks)
+    carry, d_block = start, d ** size
+    for i, end in enumerate(local[:, -1].tolist()):
+        carries[i] = carry
+        carry = d_block * carry + end
+    local += np.multiply.outer(carries, d ** (j + 1))
+    body[:] = local.ravel()[:len(x)]
+    return out
+
+def _sma_numpy(x, window, out):
+    n = len(x)
+    out[:min(window - 1, n)] = np.nan
+    if n < window:
+        return out
+    missing = np.isnan(x) if np.isnan(x.sum()) else None
+    values = x if missing is None else x[~missing]
+    # Centred before the cumsum so long histories do not lose precision
+    shift = values.mean() if len(values) else 0.0
+    sums = x - shift
+    if missing is not None:
+        sums[missing] = 0.0
+    np.cumsum(sums, out=sums)
+    out[window - 1] = sums[window - 1]
+    out[window:] = sums[window:] - sums[:-window]
+    out[window - 1:] /= window
+    out[window - 1:] += shift
+    if missing is not None:
+        gaps = np.cumsum(missing)
+        gaps[window:] -= gaps[:-window].copy()
+        out[window - 1:][gaps[window - 1:] > 0] = np.nan
+    return out
+
+# --- loop cores (compiled by numba when available) ---
+
+def _ema_loop(x, alpha, out, start):
+    prev = start
+    for i in range(len(x)):
+        if x[i] != x[i]:
+            out[i] = prev
+            continue
+        if prev != prev:
+            prev = x[i]
+        else:
+            prev += alpha * (x[i] - prev)
+        out[i] = prev
+    return out
+
+def _sma_loop(x, window, out):
+    total = 0.0
+    gaps = 0
+    for i in range(len(x)):
+        if x[i] != x[i]:
+            gaps += 1
+        else:
+            total += x[i]
+        if i >= window:
+            if x[i - window] != x[i - window]:
+                gaps -= 1
+            else:
+                total -= x[i - window]
+        # Re-sum once per window so the running sum cannot drift
+        if i >= window - 1 and (i + 1) % window == 0:
+            total = 0.0
+            for k in range(i - window + 1, i + 1):
+                if x[k] == x[k]:
+                    total += x[k]
+        out[i] = total / window if i >= window - 1 and gaps == 0 else np.nan
+    return out
+
+_CORES = {'numpy': (_ema_numpy, _sma_numpy)}
+
+def _cores():
+    if BACKEND not in _CORES:
+        from numba import njit
+        _CORES['numba'] = (njit(cache=True)(_ema_loop), njit(cache=True)(_sma_loop))
+    return _CORES[BACKEND]
+
+# --- kernels ---
+
+# ewm(alpha=alpha, adjust=False).mean(); `start` continues an earlier run
+def ema(x, alpha, out=None, start=np.nan):
+    x = as_array(x)
+    return _cores()[0](x, float(alpha), _out(out, len(x)), float(start))
+
+# rolling(window).mean()
+def sma(x, window, out=None):
+    x = as_array(x)
+    return _cores()[1](x, int(window), _out(out, len(x)))
+
+# ta.momentum.RSIIndicator: Wilder averages of up / down moves, first move zero
+def rsi(close, window=14, out=None):
+    close = as_array(close)
+    n = len(close)
+    out = _out(out, n)
+    if n == 0:
+        return out
+    change = np.empty(n)
+    change[0] = 0.0
+    np.subtract(close[1:], close[:-1], out=change[1:])
+    avg_up = ema(np.maximum(change, 0.0), 1.0 / window)
+    avg_down = ema(np.maximum(-change, 0.0), 1.0 / window)
+    rsi_from_averages(avg_up, avg_down, out)
+    out[:min(window - 1, n)] = np.nan
+    return out
+
+# 100 - 100 / (1 + avg_up / avg_down), and 100 where avg_down is 0
+def rsi_from_averages(avg_up, avg_down, out=None):
+    out = _out(out, len(avg_up))
+    moved = avg_down != 0
+    out.fill(100.0)
+    np.divide(avg_up, avg_down, out=out, where=moved)
+    np.add(out, 1.0, out=out, where=moved)
+    np.divide(100.0, out, out=out, where=moved)
+    np.subtract(100.0, out, out=out, where=moved)
+    return out
+
+# ta.trend.MACD: (macd, signal line); the signal EMA starts at the first valid MACD
+def macd(close, fast=12, slow=26, signal=9, out=None, signal_out=None):
+    close = as_array(close)
+    n = len(close)
+    out = _out(out, n)
+    signal_out = _out(signal_out, n)
+    slow_ema = ema(close, span_alpha(slow))
+    ema(close, span_alpha(fast), out=out)
+    out -= slow_ema
+    first = min(max(fast, slow) - 1, n)
+    out[:first] = np.nan
+    signal_out[:first] = np.nan
+    ema(out[first:], span_alpha(signal), out=signal_out[first:])
+    signal_out[first:min(first + signal - 1, n)] = np.nan
+    return out, signal_out
@@ -0,0 +1,109 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# CONFIG
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+SOURCE_TIMEOUT = 5   # seconds per source (connect / read)
+TOTAL_BUDGET = 8     # seconds for all sources together
+MAX_WORKERS = 8
+DEFAULT_TTL = 300    # seconds a page is served from cache without revalidating
+SOURCE_TTL = {}      # per-url overrides of DEFAULT_TTL
+
+_session = None
+_session_lock = threading.Lock()
+_pages = {}
+# Long-lived pool: a source that overruns the budget finishes in the background
+# instead of holding up the page.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='news')
+
+# One connection-pooled session shared by every fetch
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(HEADERS)
+            _session = session
+        return _session
+
+# A downloaded page plus its validators and the headline lists parsed from it.
+# Parsed results are kept per parser key, so a warm rerun does no HTML parsing.
+class CachedPage:
+    def __init__(self, url, content, etag=None, last_modified=None):
+        self.url = url
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+        self._parsed = {}
+        self._lock = threading.Lock()
+
+    def is_fresh(self):
+        return time.monotonic() - self.fetched_at < SOURCE_TTL.get(self.url, DEFAULT_TTL)
+
+    def parse(self, key, parser):
+        with self._lock:
+            if key not in self._parsed:
+                self._parsed[key] = parser(self.content)
+            return self._parsed[key]
+
+# Conditional GET: a 304 keeps the cached page (and its parsed headlines)
+def _get(url, timeout):
+    cached = _pages.get(url)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+    res = get_session().get(url, headers=headers, timeout=timeout)
+    if res.status_code == 304 and cached is not None:
+        cached.fetched_at = time.monotonic()
+        return cached
+    res.raise_for_status()
+    page = CachedPage(url, res.content, res.headers.get('ETag'), res.headers.get('Last-Modified'))
+    _pages[url] = page
+    return page
+
+# Fetch all urls concurrently. Returns ({url: CachedPage}, [missing urls]). Pages
+# still within their TTL are not requested at all; a source that errors or has
+# not answered within the total budget counts as missing.
+def fetch_pages(urls, timeout=SOURCE_TIMEOUT, budget=TOTAL_BUDGET):
+    pages, futures = {}, {}
+    for url in urls:
+        cached = _pages.get(url)
+        if cached is not None and cached.is_fresh():
+            pages[url] = cached
+        else:
+            futures[url] = _executor.submit(_get, url, timeout)
+    done, _ = wait(futures.values(), timeout=budget) if futures else (set(), set())
+    missing = []
+    for url, future in futures.items():
+        if future in done and future.exception() is None:
+            pages[url] = future.result()
+        else:
+            future.cancel()
+            missing.append(url)
+    return {url: pages[url] for url in urls if url in pages}, missing
+
+# Parsed headlines per source: ({url: parser(content)}, [missing urls]).
+# key names the parser so its results can be reused across reruns.
+def fetch_headlines(urls, key, parser, timeout=SOURCE_TIMEOUT, budget=TOTAL_BUDGET):
+    pages, missing = fetch_pages(urls, timeout, budget)
+    headlines = {}
+    for url, page in pages.items():
+        try:
+            headlines[url] = page.parse(key, parser)
+        except Exception:
+            missing.append(url)
+    return headlines, missing
+
+# Drop every cached page and parsed headline list (manual refresh)
+def clear_cache():
+    _pages.clear()
@@ -0,0 +1,114 @@
+import argparse
+import os
+import pickle
+import threading
+import time
+from iusa_engine import DEFAULT_PERIODS, TICKER, get_news_sentiment
+from iusa_store import STORE_DIR, update_bars
+from iusa_timeframes import BASE_PERIODS
+
+# Background refresh: bars are topped up just after each bar closes, news on its
+# own cadence, and both are written to the local cache (bar store + news
+# snapshot). Page renders only read those snapshots, so they never wait on
+# yfinance or the news sites. Runs as a daemon thread inside the app, or as a
+# separate worker process with `python iusa_scheduler.py`.
+
+# CONFIG
+# Only the base feeds are stored; the other timeframes are resampled from them
+WATCH = [(TICKER, interval) for interval in BASE_PERIODS]
+PERIODS = {**DEFAULT_PERIODS, **BASE_PERIODS}
+INTERVAL_SECONDS = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600, '4h': 14400, '1d': 86400, '1wk': 604800}
+BAR_GRACE = 30       # seconds after a bar boundary before asking for the new bar
+NEWS_EVERY = 600     # seconds between news refreshes
+RETRY_AFTER = 60     # seconds before retrying a failed job
+MAX_WAIT = 3600      # a still-forming daily bar is topped up at least this often
+NEWS_SNAPSHOT = os.path.join(STORE_DIR, 'news_snapshot.pkl')
+
+def next_bar_time(interval, now):
+    seconds = INTERVAL_SECONDS.get(interval, 3600)
+    return min((now // seconds + 1) * seconds + BAR_GRACE, now + MAX_WAIT)
+
+def save_news_snapshot(news_score, trigger_count, missing, path=NEWS_SNAPSHOT):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    snapshot = {'news_score': news_score, 'trigger_count': trigger_count, 'missing_sources': missing,
+                'updated': time.time()}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f)
+    os.replace(tmp_path, path)
+
+# Latest news snapshot (with its age in seconds), or None before the first refresh
+def load_news_snapshot(path=NEWS_SNAPSHOT):
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+    snapshot['age'] = time.time() - snapshot['updated']
+    return snapshot
+
+class RefreshScheduler:
+    def __init__(self, watch=WATCH, news_every=NEWS_EVERY):
+        self.news_every = news_every
+        # Everything is due immediately on start
+        self.due = {('bars', ticker, interval): 0.0 for ticker, interval in watch}
+        self.due[('news',)] = 0.0
+        self.errors = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run_job(self, job):
+        if job[0] == 'bars':
+            _, ticker, interval = job
+            update_bars(ticker, interval, PERIODS.get(interval, '60d'))
+            return next_bar_time(interval, time.time())
+        save_news_snapshot(*get_news_sentiment())
+        return time.time() + self.news_every
+
+    def run_pending(self):
+        for job, due in list(self.due.items()):
+            if due > time.time():
+                continue
+            try:
+                self.due[job] = self._run_job(job)
+                self.errors.pop(job, None)
+            except Exception as e:
+                self.errors[job] = str(e)
+                self.due[job] = time.time() + RETRY_AFTER
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            self.run_pending()
+            self._wake.wait(max(0.0, min(self.due.values()) - time.time()))
+            self._wake.clear()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.run_forever, name='iusa-refresh', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    # Make jobs due now (e.g. from a refresh button) without blocking the caller
+    def refresh_now(self, bars=True, news=True):
+        for job in self.due:
+            if (job[0] == 'bars' and bars) or (job[0] == 'news' and news):
+                self.due[job] = 0.0
+        self._wake.set()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Refresh bars and news into the local cache in the foreground.')
+    parser.add_argument('--news-every', type=int, default=NEWS_EVERY)
+    args = parser.parse_args(argv)
+    scheduler = RefreshScheduler(news_every=args.news_every)
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+if __name__ == '__main__':
+    main()
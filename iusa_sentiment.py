@@ -0,0 +1,122 @@
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+
+# CONFIG
+MAX_ENTRIES = 10000
+# Set to a file path to keep the cache across restarts
+CACHE_PATH = os.environ.get('IUSA_SENTIMENT_CACHE')
+
+def normalize(text):
+    return ' '.join(text.lower().split())
+
+def headline_key(text):
+    return hashlib.sha1(normalize(text).encode('utf-8')).hexdigest()
+
+# TextBlob (and nltk behind it) is only imported on the first cache miss
+def _polarity(text):
+    from textblob import TextBlob
+    return TextBlob(text).sentiment.polarity
+
+# All trigger words compiled into one case-insensitive alternation, so a headline
+# is scanned once however long the word list gets. Longer phrases are tried
+# first and multi-word phrases match across any whitespace.
+class TriggerMatcher:
+    def __init__(self, words):
+        self.words = tuple(words)
+        self._canonical = {normalize(word): word for word in self.words}
+        phrases = sorted(self._canonical, key=len, reverse=True)
+        alternation = '|'.join(r'\s+'.join(map(re.escape, phrase.split())) for phrase in phrases)
+        self.pattern = re.compile(rf'\b(?:{alternation})\b', re.IGNORECASE) if phrases else None
+
+    # {trigger word: count} in one pass over the text
+    def find(self, text):
+        counts = Counter()
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                counts[self._canonical[normalize(match.group(0))]] += 1
+        return dict(counts)
+
+    def matches(self, text):
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+@lru_cache(maxsize=32)
+def _matcher(words):
+    return TriggerMatcher(words)
+
+def get_matcher(trigger_words):
+    return _matcher(tuple(trigger_words))
+
+# Bounded LRU of headline hash -> polarity and trigger-word hits. Trigger hits are
+# stored per word list, since each dashboard variant configures its own.
+class SentimentCache:
+    def __init__(self, max_entries=MAX_ENTRIES, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    self._entries = pickle.load(f)
+            except Exception:
+                self._entries = OrderedDict()
+
+    # (polarity, {trigger word: count}) for a headline
+    def analyze(self, text, trigger_words=()):
+        key = headline_key(text)
+        words = tuple(trigger_words)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and words in entry[1]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1][words]
+            self.misses += 1
+        polarity = entry[0] if entry is not None else _polarity(text)
+        triggers = get_matcher(words).find(text)
+        with self._lock:
+            entry = self._entries.setdefault(key, (polarity, {}))
+            entry[1][words] = triggers
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+        return polarity, triggers
+
+    def polarity(self, text):
+        return self.analyze(text)[0]
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        # Saves come from the scheduler and from page threads: one at a time here,
+        # and through a temp file of their own so other processes cannot clash
+        with self._save_lock:
+            with self._lock:
+                data = pickle.dumps(self._entries)
+                self._dirty = False
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+# Shared by every dashboard variant in this process
+sentiment_cache = SentimentCache(path=CACHE_PATH)
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import uuid
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+# Column-oriented OHLCV buffer for cross-process indicator work. One block holds
+# the int64 timestamps followed by one contiguous float64 run per column; it
+# lives in a multiprocessing.shared_memory segment or a memory-mapped file.
+# Workers attach with the small picklable handle and get NumPy views, so memory
+# stays flat however many workers map it.
+
+# CONFIG
+COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+class SharedBars:
+    def __init__(self, handle, buffer, owner=False, keepalive=None):
+        self.handle = handle
+        self.backend, self.name, self.length, self.columns, self.tz = handle
+        self.owner = owner
+        self._keepalive = keepalive
+        block = np.ndarray((len(self.columns) + 1, self.length), dtype=np.float64, buffer=buffer)
+        if not owner:
+            block.flags.writeable = False
+        self._block = block
+        self.timestamps = block[0].view(np.int64)
+        self._views = {name: block[i + 1] for i, name in enumerate(self.columns)}
+
+    # Copy df into a new block once; backend is 'shm' or 'mmap' (path optional)
+    @classmethod
+    def from_frame(cls, df, columns=None, backend='shm', path=None):
+        columns = tuple(c for c in (columns or COLUMNS) if c in df.columns)
+        length = len(df)
+        size = max((len(columns) + 1) * length * 8, 8)
+        index = pd.DatetimeIndex(df.index).as_unit('ns')
+        tz = str(index.tz) if index.tz is not None else None
+        if backend == 'shm':
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            handle = ('shm', shm.name, length, columns, tz)
+            bars = cls(handle, shm.buf, owner=True, keepalive=shm)
+        elif backend == 'mmap':
+            path = path or os.path.join(tempfile.gettempdir(), f'iusa_bars_{uuid.uuid4().hex}.f64')
+            mm = np.memmap(path, dtype=np.float64, mode='w+', shape=(size // 8,))
+            handle = ('mmap', path, length, columns, tz)
+            bars = cls(handle, mm, owner=True, keepalive=mm)
+        else:
+            raise ValueError(f'unknown backend: {backend}')
+        bars.timestamps[:] = index.tz_convert(None).asi8 if tz else index.asi8
+        for name in columns:
+            bars._views[name][:] = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float64)
+        return bars
+
+    # Zero-copy, read-only attach from another process
+    @classmethod
+    def attach(cls, handle):
+        backend, name, length, columns, _ = handle
+        if backend == 'shm':
+            shm = shared_memory.SharedMemory(name=name)
+            return cls(handle, shm.buf, keepalive=shm)
+        mm = np.memmap(name, dtype=np.float64, mode='r', shape=(max((len(columns) + 1) * length, 1),))
+        return cls(handle, mm, keepalive=mm)
+
+    def column(self, name):
+        return self._views[name]
+
+    @property
+    def index(self):
+        index = pd.DatetimeIndex(self.timestamps.view('datetime64[ns]'))
+        return index.tz_localize('UTC').tz_convert(self.tz) if self.tz else index
+
+    def series(self, name, index=None):
+        return pd.Series(self._views[name], index=self.index if index is None else index, name=name, copy=False)
+
+    def frame(self, columns=None):
+        index = self.index
+        return pd.DataFrame({name: self._views[name] for name in (columns or self.columns)}, index=index, copy=False)
+
+    def close(self):
+        self._views = {}
+        self.timestamps = None
+        self._block = None
+        if self.backend == 'shm' and self._keepalive is not None:
+            self._keepalive.close()
+        self._keepalive = None
+
+    # Owner only: release the segment / delete the file once workers are done
+    def unlink(self):
+        keepalive = self._keepalive
+        self.close()
+        if self.backend == 'shm':
+            if keepalive is not None:
+                keepalive.unlink()
+        elif os.path.exists(self.name):
+            os.remove(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
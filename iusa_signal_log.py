@@ -0,0 +1,178 @@
+import atexit
+import fcntl
+import os
+import re
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+# Append-only log of every computed signal with the inputs it was computed
+# from, one file per (ticker, interval). Records are fixed-width binary, so an
+# append is a single write at the end of the file and record i sits at
+# i * RECORD.itemsize. Records are kept in bar-timestamp order, which makes the
+# timestamp column its own index: range reads binary-search it through a
+# memory map instead of scanning the file. Writes go straight to the OS (other
+# processes see them at once); fsync is batched. Several writers may share a
+# file (the dashboard and `iusa_engine.py --log`): each append holds an flock
+# and checks the order against the file's last record, not a cached one.
+
+# CONFIG
+LOG_DIR = os.environ.get('IUSA_SIGNAL_LOG_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.signal_log'))
+FSYNC_EVERY = 32     # records
+FSYNC_SECONDS = 5.0  # or this long after the first unsynced record
+TECH_SIGNALS = ('Hold', 'Buy', 'Sell', 'Buy (Momentum)')
+FINAL_SIGNALS = ('HOLD', 'BUY', 'SELL')
+# Snapshot column -> record field
+VALUES = {'Close': 'close', 'RSI': 'rsi', 'MACD': 'macd', 'Signal_Line': 'signal_line', '50_MA': 'ma_50', '200_MA': 'ma_200'}
+RECORD = np.dtype([
+    ('timestamp', '<i8'),  # bar time, UTC nanoseconds
+    ('logged', '<i8'),     # wall-clock time of the append, UTC nanoseconds
+    *[(field, '<f8') for field in VALUES.values()],
+    ('news_score', '<f8'),
+    ('trigger_count', '<i4'),
+    ('tech_signal', 'u1'),
+    ('signal', 'u1'),
+    ('pad', 'V2'),
+])
+
+def log_path(ticker, interval, root=None):
+    safe_ticker = re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)
+    return os.path.join(root or LOG_DIR, f'{safe_ticker}_{interval}.log')
+
+def _utc_ns(timestamp):
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tz is not None:
+        timestamp = timestamp.tz_convert(None)
+    return timestamp.as_unit('ns').value
+
+class SignalLog:
+    def __init__(self, ticker, interval, root=None):
+        self.path = log_path(ticker, interval, root)
+        self._fd = None
+        self._pending = 0
+        self._first_pending = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        try:
+            return os.path.getsize(self.path) // RECORD.itemsize
+        except OSError:
+            return 0
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+
+    # Last complete record in the file, or None; call with the flock held
+    def _last_record(self):
+        size = os.fstat(self._fd).st_size
+        length = size // RECORD.itemsize
+        # A torn record left by a crash mid-write is dropped before appending
+        if size != length * RECORD.itemsize:
+            os.ftruncate(self._fd, length * RECORD.itemsize)
+        if length == 0:
+            return None
+        return np.frombuffer(os.pread(self._fd, RECORD.itemsize, (length - 1) * RECORD.itemsize), dtype=RECORD).copy()
+
+    @staticmethod
+    def _key(record):
+        record['logged'] = 0
+        return record.tobytes()
+
+    # Logs one signal and its inputs. `values` is the bar's row (or a dict) with
+    # the VALUES columns. Returns False when it repeats the last record or is
+    # older than it.
+    def append(self, timestamp, values, tech_signal, signal, news_score=0.0, trigger_count=0):
+        record = np.zeros(1, dtype=RECORD)
+        record['timestamp'] = _utc_ns(timestamp)
+        for column, field in VALUES.items():
+            value = values.get(column, np.nan)
+            record[field] = np.nan if value is None else float(value)
+        record['news_score'] = news_score
+        record['trigger_count'] = trigger_count
+        record['tech_signal'] = TECH_SIGNALS.index(tech_signal) if tech_signal in TECH_SIGNALS else 255
+        record['signal'] = FINAL_SIGNALS.index(signal) if signal in FINAL_SIGNALS else 255
+        with self._lock:
+            if self._fd is None:
+                self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                last = self._last_record()
+                if last is not None and (self._key(record.copy()) == self._key(last)
+                                         or record['timestamp'][0] < last['timestamp'][0]):
+                    return False
+                record['logged'] = time.time_ns()
+                os.write(self._fd, record.tobytes())
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._pending += 1
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+            if self._pending >= FSYNC_EVERY or time.monotonic() - self._first_pending >= FSYNC_SECONDS:
+                self._sync()
+            return True
+
+    def _sync(self):
+        if self._fd is not None and self._pending:
+            os.fsync(self._fd)
+        self._pending = 0
+        self._first_pending = None
+
+    def sync(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _records(self):
+        length = len(self)
+        if length == 0:
+            return np.empty(0, dtype=RECORD)
+        return np.memmap(self.path, dtype=RECORD, mode='r', shape=(length,))
+
+    # Records with bar time in [start, end], or the last `last` of them, as a
+    # DataFrame indexed by bar time (UTC)
+    def read(self, start=None, end=None, last=None):
+        records = self._records()
+        stamps = records['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(stamps, _utc_ns(start), 'left'))
+        hi = len(records) if end is None else int(np.searchsorted(stamps, _utc_ns(end), 'right'))
+        if last is not None:
+            lo = max(lo, hi - last)
+        chunk = np.array(records[lo:hi])
+        tech = np.array(TECH_SIGNALS + ('',) * (256 - len(TECH_SIGNALS)), dtype=object)
+        final = np.array(FINAL_SIGNALS + ('',) * (256 - len(FINAL_SIGNALS)), dtype=object)
+        df = pd.DataFrame({column: chunk[field] for column, field in VALUES.items()},
+                          index=pd.DatetimeIndex(chunk['timestamp'].view('datetime64[ns]'), tz='UTC', name='Date'))
+        df['news_score'] = chunk['news_score']
+        df['trigger_count'] = chunk['trigger_count']
+        df['tech_signal'] = tech[chunk['tech_signal']]
+        df['signal'] = final[chunk['signal']]
+        df['logged'] = pd.DatetimeIndex(chunk['logged'].view('datetime64[ns]'), tz='UTC')
+        return df
+
+# Rows of a read() frame where the final signal differs from the row before
+def signal_changes(history):
+    return history[history['signal'] != history['signal'].shift()]
+
+_logs = {}
+_logs_lock = threading.Lock()
+
+def get_log(ticker, interval):
+    with _logs_lock:
+        key = (ticker, interval)
+        if key not in _logs:
+            _logs[key] = SignalLog(ticker, interval)
+        return _logs[key]
+
+@atexit.register
+def close_all():
+    with _logs_lock:
+        for log in _logs.values():
+            log.close()
@@ -0,0 +1,155 @@
+import fcntl
+import math
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+
+# CONFIG
+# One pickle per (ticker, interval), indexed by bar timestamp.
+STORE_DIR = os.environ.get('IUSA_STORE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bar_store'))
+PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+TRADING_DAYS_PER_YEAR = 252
+# Bars per trading day (LSE session, 08:00-16:30; hourly bars are 08:00..16:00).
+# Turns a warm-up bar count into days, and annualises backtest returns.
+BARS_PER_DAY = {'1m': 510, '5m': 102, '15m': 34, '30m': 17, '1h': 9, '4h': 2, '1d': 1,
+                '1wk': 52 / TRADING_DAYS_PER_YEAR}
+# Longest history yfinance serves per intraday interval
+MAX_PERIOD_DAYS = {'1m': 7, '5m': 60, '15m': 60, '30m': 60, '1h': 730}
+HOLIDAY_SLACK_DAYS = 7
+# Largest relative Close difference on a re-downloaded closed bar still taken as unchanged
+ADJUST_RTOL = 1e-6
+
+def store_path(ticker, interval):
+    safe_ticker = re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)
+    return os.path.join(STORE_DIR, f'{safe_ticker}_{interval}.pkl')
+
+# yfinance period string ('60d', '6mo', '1y') -> DateOffset, None for 'max'
+def period_offset(period):
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        return None
+    count, unit = match.groups()
+    return pd.DateOffset(**{PERIOD_UNITS[unit]: int(count)})
+
+# A period long enough to hold `period` plus `bars` earlier bars of `interval`
+def warmup_period(period, interval, bars):
+    offset = period_offset(period)
+    if offset is None or bars <= 0:
+        return period
+    now = pd.Timestamp.now()
+    days = (now - (now - offset)).days + math.ceil(bars / BARS_PER_DAY.get(interval, 1) * 7 / 5) + HOLIDAY_SLACK_DAYS
+    return f'{min(days, MAX_PERIOD_DAYS.get(interval, days))}d'
+
+def clean_bars(df):
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    df = df.dropna()
+    df = df[~df.index.duplicated(keep='last')]
+    return df.sort_index()
+
+def load_bars(ticker, interval):
+    path = store_path(ticker, interval)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+# Serializes writers of one (ticker, interval) file, across threads and processes
+@contextmanager
+def store_lock(ticker, interval):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    fd = os.open(store_path(ticker, interval) + '.lock', os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+def save_bars(df, ticker, interval):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    path = store_path(ticker, interval)
+    # A temp file of its own, so concurrent writers never replace each other's
+    fd, tmp_path = tempfile.mkstemp(dir=STORE_DIR, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            df.to_pickle(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _covers(stored, period):
+    offset = period_offset(period)
+    if offset is None:
+        return True
+    # Allow a week of slack for weekends and holidays at the start of the window
+    wanted_start = pd.Timestamp.now(tz=stored.index.tz) - offset + pd.Timedelta(days=7)
+    return stored.index[0] <= wanted_start
+
+# The last `period` of df, plus up to `warmup` bars before it
+def window_bars(df, period, warmup=0):
+    offset = period_offset(period)
+    if offset is None or df.empty:
+        return df
+    start = df.index.searchsorted(df.index[-1] - offset)
+    return df.iloc[max(0, start - warmup):]
+
+# Warm-up bars df holds before the last `period`; window_bars(df, period, warmup)
+# returns fewer than `warmup` when this is smaller
+def warmup_available(df, period):
+    offset = period_offset(period)
+    if offset is None or df.empty:
+        return 0
+    return int(df.index.searchsorted(df.index[-1] - offset))
+
+# yfinance history is adjusted for dividends and splits, so an ex-date rescales
+# every earlier bar. True when `fresh` disagrees with the closed bars stored at
+# the same timestamps (the last stored bar may still have been forming).
+def _readjusted(stored, fresh):
+    common = stored.index[:-1].intersection(fresh.index)
+    return not np.allclose(stored.loc[common, 'Close'], fresh.loc[common, 'Close'], rtol=ADJUST_RTOL)
+
+# Read the local store, then only download bars from the last stored timestamp on.
+# The last stored bar is requested again because it may still have been forming,
+# and the closed bar before it as a check: when its Close changed, the history
+# was re-adjusted and is downloaded again in full rather than patched.
+def update_bars(ticker, interval, period):
+    import yfinance as yf
+    with store_lock(ticker, interval):
+        stored = load_bars(ticker, interval)
+        if stored is not None and not stored.empty and _covers(stored, period):
+            try:
+                delta = clean_bars(yf.download(ticker, start=stored.index[max(0, len(stored) - 2)], interval=interval))
+            except Exception:
+                delta = stored.iloc[:0]
+            if delta.empty:
+                return window_bars(stored, period)
+            if not _readjusted(stored, delta):
+                bars = pd.concat([stored[stored.index < delta.index[0]], delta])
+                save_bars(bars, ticker, interval)
+                return window_bars(bars, period)
+        bars = clean_bars(yf.download(ticker, period=period, interval=interval))
+        if stored is not None and not stored.empty:
+            # A failed download (empty frame) keeps serving what is stored
+            if bars.empty:
+                return window_bars(stored, period)
+            # Older stored bars are only kept while they match the new adjustment
+            if not _readjusted(stored, bars):
+                bars = clean_bars(pd.concat([stored[stored.index < bars.index[0]], bars]))
+        if not bars.empty:
+            save_bars(bars, ticker, interval)
+        return window_bars(bars, period)
+
+# Stored bars without touching the network, plus seconds since they last changed
+def read_stored_bars(ticker, interval, period, warmup=0):
+    stored = load_bars(ticker, interval)
+    if stored is None or stored.empty:
+        return None, None
+    age = time.time() - os.path.getmtime(store_path(ticker, interval))
+    return window_bars(stored, period, warmup), age
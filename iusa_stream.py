@@ -0,0 +1,135 @@
+import math
+import time
+from collections import deque
+import pandas as pd
+from iusa_engine import INTERVAL, TICKER, final_signal, tech_signal_for
+from iusa_indicators import IndicatorEngine
+from iusa_scheduler import INTERVAL_SECONDS
+from iusa_store import load_bars, update_bars
+
+# Streaming mode: bars (or ticks rolled up into bars) arrive from a feed, the
+# indicators are updated one bar at a time, the signal is re-evaluated on each
+# bar close, and only the values that changed are passed on to the page.
+# A feed is any iterable of (timestamp, bar) where bar has at least 'Close'.
+
+# CONFIG
+LATENCY_WINDOW = 500  # bars kept for the latency stats
+
+# Replays stored bars, optionally paced (seconds between bars) for demos
+class ReplayFeed:
+    def __init__(self, ticker=TICKER, interval=INTERVAL, bars=None, start=None, pace=0.0):
+        self.bars = bars if bars is not None else load_bars(ticker, interval)
+        if self.bars is None:
+            raise ValueError(f'no stored bars for {ticker} {interval}')
+        if start is not None:
+            self.bars = self.bars[self.bars.index >= start]
+        self.pace = pace
+
+    def __iter__(self):
+        for timestamp, bar in zip(self.bars.index, self.bars.to_dict('records')):
+            yield timestamp, bar
+            if self.pace:
+                time.sleep(self.pace)
+
+# Polls the bar store for closed bars. The last bar is held back only while
+# it can still be forming (its interval has not ended), so the session's
+# closing bar goes out as soon as it is complete, not with the next session.
+class PollingFeed:
+    def __init__(self, ticker=TICKER, interval=INTERVAL, period='5d', every=None):
+        self.ticker = ticker
+        self.interval = interval
+        self.period = period
+        self.every = every or INTERVAL_SECONDS.get(interval, 3600) / 4
+        self.bar_length = pd.Timedelta(seconds=INTERVAL_SECONDS.get(interval, 3600))
+        self.last_seen = None
+
+    def closed_bars(self, bars, now=None):
+        if bars.empty:
+            return bars
+        now = now if now is not None else pd.Timestamp.now(tz=bars.index.tz)
+        return bars.iloc[:-1] if bars.index[-1] + self.bar_length > now else bars
+
+    def __iter__(self):
+        while True:
+            bars = self.closed_bars(update_bars(self.ticker, self.interval, self.period))
+            if self.last_seen is not None:
+                bars = bars[bars.index > self.last_seen]
+            for timestamp, bar in zip(bars.index, bars.to_dict('records')):
+                self.last_seen = timestamp
+                yield timestamp, bar
+            time.sleep(self.every)
+
+# Rolls ticks up into OHLCV bars; add() returns the bar it closed, if any
+class TickBarBuilder:
+    def __init__(self, interval=INTERVAL):
+        self.freq = pd.Timedelta(seconds=INTERVAL_SECONDS.get(interval, 3600))
+        self.start = None
+        self.bar = None
+
+    def add(self, timestamp, price, volume=0.0):
+        start = pd.Timestamp(timestamp).floor(self.freq)
+        closed = None
+        if self.bar is not None and start != self.start:
+            closed = (self.start, self.bar)
+            self.bar = None
+        if self.bar is None:
+            self.start = start
+            self.bar = {'Open': price, 'High': price, 'Low': price, 'Close': price, 'Volume': volume}
+        else:
+            self.bar['High'] = max(self.bar['High'], price)
+            self.bar['Low'] = min(self.bar['Low'], price)
+            self.bar['Close'] = price
+            self.bar['Volume'] += volume
+        return closed
+
+    # Tick iterable of (timestamp, price, volume) -> feed of closed bars
+    def feed(self, ticks):
+        for timestamp, price, volume in ticks:
+            closed = self.add(timestamp, price, volume)
+            if closed is not None:
+                yield closed
+
+class SignalStream:
+    def __init__(self, news_score=0, trigger_count=0):
+        self.engine = IndicatorEngine()
+        self.news_score = news_score
+        self.trigger_count = trigger_count
+        self.state = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    # One closed bar in; returns {field: value} for the fields that changed
+    def on_bar(self, timestamp, bar):
+        started = time.perf_counter()
+        values = self.engine.push(bar['Close'])
+        tech = tech_signal_for(values)
+        values.update({
+            'Close': float(bar['Close']),
+            'tech_signal': tech,
+            'signal': final_signal(tech, self.news_score, self.trigger_count),
+        })
+        changed = {key: value for key, value in values.items() if not _same(self.state.get(key), value)}
+        self.state.update(values)
+        self.state['timestamp'] = timestamp
+        changed['timestamp'] = timestamp
+        self.latencies.append(time.perf_counter() - started)
+        return changed
+
+    def run(self, feed):
+        for timestamp, bar in feed:
+            yield self.on_bar(timestamp, bar)
+
+    # Per-bar update latency in milliseconds
+    def latency_stats(self):
+        if not self.latencies:
+            return {'last_ms': None, 'mean_ms': None, 'p95_ms': None}
+        ordered = sorted(self.latencies)
+        return {
+            'last_ms': self.latencies[-1] * 1000,
+            'mean_ms': sum(ordered) / len(ordered) * 1000,
+            'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        }
+
+def _same(old, new):
+    if isinstance(old, float) and isinstance(new, float):
+        return old == new or (math.isnan(old) and math.isnan(new))
+    return old == new
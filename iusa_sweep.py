@@ -0,0 +1,136 @@
+import argparse
+import itertools
+import os
+import random
+from functools import lru_cache
+from multiprocessing import Pool
+import numpy as np
+import pandas as pd
+import iusa_kernels as kernels
+from iusa_backtest import backtest
+from iusa_engine import tech_signal_series
+from iusa_enriched import load_enriched
+from iusa_shm import SharedBars
+
+# Grid / random search over the RSI, MACD and MA parameters of the technical
+# rules. The close prices are put in one SharedBars block that every worker
+# maps, instead of pickling the DataFrame into each task.
+
+# CONFIG
+SPACE = {
+    'rsi_window': [7, 14, 21],
+    'rsi_low': [20, 25, 30, 35],
+    'rsi_high': [65, 70, 75, 80],
+    'macd_fast': [8, 12, 16],
+    'macd_slow': [21, 26, 34],
+    'macd_signal': [5, 9, 12],
+    'ma_fast': [20, 50, 100],
+    'ma_slow': [100, 150, 200],
+}
+RANK_BY = 'total_return'
+CHUNKSIZE = 16
+
+def valid_params(params):
+    return params['macd_fast'] < params['macd_slow'] and params['ma_fast'] < params['ma_slow'] \
+        and params['rsi_low'] < params['rsi_high']
+
+def grid_params(space=SPACE):
+    keys = list(space)
+    for values in itertools.product(*(space[key] for key in keys)):
+        params = dict(zip(keys, values))
+        if valid_params(params):
+            yield params
+
+def random_params(space=SPACE, samples=1000, seed=None):
+    rng = random.Random(seed)
+    drawn = 0
+    while drawn < samples:
+        params = {key: rng.choice(values) for key, values in space.items()}
+        if valid_params(params):
+            drawn += 1
+            yield params
+
+# --- worker side ---
+_bars = None
+_close = None
+_backtest_kwargs = {}
+
+def _init_worker(handle, backtest_kwargs):
+    global _bars, _close, _backtest_kwargs
+    _bars = SharedBars.attach(handle)
+    _close = _bars.series('Close', index=pd.RangeIndex(_bars.length))
+    _backtest_kwargs = backtest_kwargs
+
+# Indicator pieces are cached per worker, so combinations that only differ in
+# thresholds reuse them
+@lru_cache(maxsize=64)
+def _rsi(window):
+    return pd.Series(kernels.rsi(_close.to_numpy(), window), index=_close.index)
+
+@lru_cache(maxsize=64)
+def _macd(fast, slow, signal):
+    macd, signal_line = kernels.macd(_close.to_numpy(), fast, slow, signal)
+    return pd.Series(macd, index=_close.index), pd.Series(signal_line, index=_close.index)
+
+@lru_cache(maxsize=64)
+def _sma(window):
+    return pd.Series(kernels.sma(_close.to_numpy(), window), index=_close.index)
+
+def evaluate(params):
+    macd, signal_line = _macd(params['macd_fast'], params['macd_slow'], params['macd_signal'])
+    df = pd.DataFrame({
+        'RSI': _rsi(params['rsi_window']),
+        'MACD': macd,
+        'Signal_Line': signal_line,
+        'fast_MA': _sma(params['ma_fast']),
+        'slow_MA': _sma(params['ma_slow']),
+    })
+    labels = tech_signal_series(df, params['rsi_low'], params['rsi_high'], 'fast_MA', 'slow_MA')
+    return {**params, **backtest(_close, labels, **_backtest_kwargs)['stats']}
+
+# --- parent side ---
+
+# Yields one result dict per parameter set as workers finish (unordered).
+# Stop iterating to end the search early; the pool is torn down either way.
+def sweep(close, params_iter, processes=None, **backtest_kwargs):
+    frame = pd.DataFrame({'Close': np.asarray(close, dtype=np.float64)},
+                         index=close.index if isinstance(close.index, pd.DatetimeIndex) else None)
+    with SharedBars.from_frame(frame, columns=('Close',)) as bars:
+        with Pool(processes or os.cpu_count(), _init_worker, (bars.handle, backtest_kwargs)) as pool:
+            yield from pool.imap_unordered(evaluate, params_iter, chunksize=CHUNKSIZE)
+
+# Ranked table of everything evaluated so far, best first
+def rank(results, by=RANK_BY, top=None):
+    table = pd.DataFrame(results)
+    if table.empty:
+        return table
+    table = table.sort_values(by, ascending=False, ignore_index=True)
+    return table.head(top) if top else table
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parallel parameter sweep over the technical signal rules.')
+    parser.add_argument('csv', help='CSV with a Date index and a Close column')
+    parser.add_argument('--random', type=int, default=0, help='sample this many combinations instead of the full grid')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--fee-bps', type=float, default=0.0)
+    parser.add_argument('--slippage-bps', type=float, default=0.0)
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--every', type=int, default=500, help='print the ranking after this many results')
+    args = parser.parse_args(argv)
+    close = load_enriched(args.csv, columns=['Close'])['Close']
+    params_iter = random_params(samples=args.random, seed=args.seed) if args.random else grid_params()
+    results = []
+    try:
+        for result in sweep(close, params_iter, args.processes, fee_bps=args.fee_bps, slippage_bps=args.slippage_bps):
+            results.append(result)
+            if len(results) % args.every == 0:
+                print(f'--- {len(results)} evaluated ---')
+                print(rank(results, top=args.top).to_string())
+    except KeyboardInterrupt:
+        print('Stopped early.')
+    print(f'=== {len(results)} evaluated ===')
+    print(rank(results, top=args.top).to_string())
+
+if __name__ == '__main__':
+    main()
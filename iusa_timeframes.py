@@ -0,0 +1,78 @@
+import threading
+import numpy as np
+import pandas as pd
+
+# Every timeframe is derived from a stored base feed by resampling, so
+# switching timeframe never needs a download: 1h and 4h from the hourly feed,
+# 1d and 1wk from the daily feed. yfinance caps hourly history at 730 days
+# (about 105 weeks), too short for a 200-week MA plus its warm-up; daily
+# history is not capped, so the daily feed is kept much longer. Resampled bars
+# are cached per (ticker, timeframe) and rebuilt only when the base bars change;
+# indicators then extend incrementally per timeframe (get_engine(ticker, tf)).
+# Buckets follow the bars' own (exchange) timezone, so a '1d' bar is one
+# trading day and a '1wk' bar starts on Monday. Intraday buckets start at each
+# session's open rather than at midnight: LSE hourly bars run 08:00..16:00, so
+# '4h' is 08:00-12:00 and 12:00-16:30, with the 16:00 closing print folded
+# into the afternoon bar instead of standing alone as a one-bar '4h' bar.
+
+# CONFIG
+# Stored feed -> how much of it is kept
+BASE_PERIODS = {'1h': '730d', '1d': '10y'}  # 730d is the longest hourly history yfinance serves
+# timeframe -> the feed it is resampled from
+TIMEFRAME_BASES = {'1h': '1h', '4h': '1h', '1d': '1d', '1wk': '1d'}
+# timeframe -> pandas resample rule
+TIMEFRAMES = {'1h': '1h', '4h': '4h', '1d': '1D', '1wk': 'W-MON'}
+# How much of each timeframe the pages show by default
+TIMEFRAME_PERIODS = {'1h': '60d', '4h': '6mo', '1d': '1y', '1wk': '2y'}
+# Intraday timeframes, bucketed from each session's open
+SESSION_TIMEFRAMES = ('4h',)
+OHLCV = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+_frames = {}
+_lock = threading.Lock()
+
+# Row position of the first base bar of each row's session bucket. Buckets are
+# `width` long from the day's first bar; a last bucket covering less than half
+# of `width` is merged into the one before it.
+def _session_buckets(index, width, base_width):
+    wall = (index.tz_localize(None) if index.tz is not None else index).as_unit('ns').asi8
+    day = wall // pd.Timedelta('1D').value
+    opens = pd.Series(wall).groupby(day).transform('min').to_numpy()
+    slot = (wall - opens) // width.value
+    last = pd.Series(slot).groupby(day).transform('max').to_numpy()
+    size = pd.Series(slot).groupby([day, slot]).transform('size').to_numpy()
+    short = (slot == last) & (slot > 0) & (size * base_width < width / 2)
+    slot = np.where(short, slot - 1, slot)
+    return pd.Series(np.arange(len(index))).groupby([day, slot]).transform('min').to_numpy()
+
+# Base bars -> OHLCV bars of `timeframe`; buckets without any base bar are dropped
+def resample_bars(base, timeframe):
+    agg = {col: how for col, how in OHLCV.items() if col in base.columns}
+    if timeframe in SESSION_TIMEFRAMES:
+        # Each bucket is labelled with its first base bar
+        width, base_width = pd.Timedelta(TIMEFRAMES[timeframe]), pd.Timedelta(TIMEFRAME_BASES[timeframe])
+        bars = base.groupby(base.index[_session_buckets(base.index, width, base_width)]).agg(agg)
+    else:
+        bars = base.resample(TIMEFRAMES[timeframe], label='left', closed='left').agg(agg)
+    return bars.dropna(subset=['Close'])
+
+def _base_key(base):
+    return len(base), base.index[0], base.index[-1], tuple(base.iloc[-1])
+
+def timeframe_bars(base, ticker, timeframe):
+    if timeframe == TIMEFRAME_BASES[timeframe] or base.empty:
+        return base
+    key = (ticker, timeframe)
+    base_key = _base_key(base)
+    with _lock:
+        cached = _frames.get(key)
+        if cached is not None and cached[0] == base_key:
+            return cached[1]
+    bars = resample_bars(base, timeframe)
+    with _lock:
+        _frames[key] = (base_key, bars)
+    return bars
+
+def clear_cache():
+    with _lock:
+        _frames.clear()
@@ -0,0 +1,13 @@
+import os
+import sys
+import pytest
+
+# The iusa_* modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import iusa_kernels
+
+# Runs a test once per kernel backend (numpy, and numba when installed)
+@pytest.fixture(params=iusa_kernels.BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(iusa_kernels, 'BACKEND', request.param)
+    return request.param
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+from iusa_indicators import IndicatorEngine
+
+BARS = 2000
+
+pytestmark = pytest.mark.usefixtures('backend')
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2020-01-01', periods=BARS, freq='h')
+    return pd.DataFrame({'Close': 300 + rng.standard_normal(BARS).cumsum()}, index=index)
+
+# What add_indicators() computed with ta before the engine
+def with_ta(close):
+    macd = ta.trend.MACD(close=close)
+    return pd.DataFrame({
+        'RSI': ta.momentum.RSIIndicator(close=close, window=14).rsi(),
+        'MACD': macd.macd(),
+        'Signal_Line': macd.macd_signal(),
+        '50_MA': close.rolling(window=50).mean(),
+        '200_MA': close.rolling(window=200).mean(),
+    })
+
+def assert_matches(result, expected):
+    assert list(result.index) == list(expected.index)
+    for col in expected.columns:
+        np.testing.assert_allclose(result[col], expected[col], rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=col)
+
+def test_cold_extend_matches_ta(bars):
+    assert_matches(IndicatorEngine().extend(bars), with_ta(bars['Close']))
+
+def test_revised_last_bar_matches_ta(bars):
+    engine = IndicatorEngine()
+    engine.extend(bars.iloc[:1500])
+    revised = bars.iloc[:1500].copy()
+    revised.iloc[-1, 0] += 5.0
+    assert_matches(engine.extend(revised), with_ta(revised['Close']))
+    # The revision is itself provisional: the original bar and new ones replace it
+    assert_matches(engine.extend(bars.iloc[:1800]), with_ta(bars['Close'].iloc[:1800]))
+
+def test_moved_window_start_matches_ta(bars):
+    engine = IndicatorEngine()
+    engine.extend(bars.iloc[:1900])
+    # The window drops its first 100 bars and gains new ones; the dropped bars
+    # stay as warm-up, so values equal ta over the whole history
+    moved = engine.extend(bars.iloc[100:])
+    assert_matches(moved, with_ta(bars['Close']).iloc[100:])
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+import iusa_kernels
+
+pytestmark = pytest.mark.usefixtures('backend')
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(0)
+    close = pd.Series(300 + rng.standard_normal(20000).cumsum())
+    close.iloc[5000:5100] = close.iloc[5000]  # a stretch with no moves
+    return close
+
+def assert_close(result, expected):
+    np.testing.assert_allclose(result, np.asarray(expected, dtype=float), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+def test_rsi_matches_ta(close):
+    assert_close(iusa_kernels.rsi(close.to_numpy(), 14), ta.momentum.RSIIndicator(close=close, window=14).rsi())
+
+def test_macd_matches_ta(close):
+    macd, signal = iusa_kernels.macd(close.to_numpy())
+    expected = ta.trend.MACD(close=close)
+    assert_close(macd, expected.macd())
+    assert_close(signal, expected.macd_signal())
+
+@pytest.mark.parametrize('window', [1, 50, 200])
+def test_sma_matches_rolling_mean(close, window):
+    assert_close(iusa_kernels.sma(close.to_numpy(), window), close.rolling(window).mean())
+
+def test_ema_matches_ewm(close):
+    assert_close(iusa_kernels.ema(close.to_numpy(), 0.1), close.ewm(alpha=0.1, adjust=False).mean())
+
+def test_ema_continues_from_start(close):
+    values = close.to_numpy()
+    full = iusa_kernels.ema(values, 0.1)
+    assert_close(iusa_kernels.ema(values[1000:], 0.1, start=full[999]), full[1000:])
+
+def test_short_input(close):
+    values = close.to_numpy()[:10]
+    assert np.isnan(iusa_kernels.sma(values, 50)).all()
+    assert np.isnan(iusa_kernels.rsi(values, 14)).all()
+    assert len(iusa_kernels.ema(values[:0], 0.1)) == 0
+
+def test_out_buffer_is_filled_in_place(close):
+    values = close.to_numpy()
+    out = np.empty(len(values))
+    assert iusa_kernels.sma(values, 50, out=out) is out
+    with pytest.raises(ValueError):
+        iusa_kernels.sma(values, 50, out=np.empty(len(values) - 1))
+
+@pytest.fixture
+def gappy(close):
+    close = close.iloc[:1000].copy()
+    close.iloc[[0, 1, 400, 401, 402, 777]] = np.nan
+    return close
+
+@pytest.mark.parametrize('window', [1, 50, 200])
+def test_sma_with_missing_values_matches_rolling_mean(gappy, window):
+    assert_close(iusa_kernels.sma(gappy.to_numpy(), window), gappy.rolling(window).mean())
+
+def test_ema_skips_missing_values(gappy):
+    assert_close(iusa_kernels.ema(gappy.to_numpy(), 0.1), gappy.ewm(alpha=0.1, adjust=False, ignore_na=True).mean())
+    values = gappy.to_numpy()[400:]
+    assert_close(iusa_kernels.ema(values, 0.1, start=5.0),
+                 pd.Series(np.r_[5.0, values]).ewm(alpha=0.1, adjust=False, ignore_na=True).mean()[1:])
+
+# Every kernel gives the same values on either backend when the input has gaps
+def test_backends_agree_on_missing_values(gappy, monkeypatch):
+    values = gappy.to_numpy()
+    results = {}
+    for backend in iusa_kernels.BACKENDS:
+        monkeypatch.setattr(iusa_kernels, 'BACKEND', backend)
+        results[backend] = [iusa_kernels.sma(values, 50), iusa_kernels.ema(values, 0.1),
+                            iusa_kernels.rsi(values, 14), *iusa_kernels.macd(values)]
+    for result in results.values():
+        for got, want in zip(result, results['numpy']):
+            assert_close(got, want)
+
+def test_infinite_values_are_rejected():
+    with pytest.raises(ValueError):
+        iusa_kernels.sma(np.array([1.0, np.inf, 2.0]), 2)
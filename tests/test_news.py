@@ -0,0 +1,119 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import iusa_news
+
+SLOW_SECONDS = 0.5
+SLACK = 0.5  # seconds allowed over a budget for thread and socket overhead
+ETAG = '"v1"'
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        self.server.hits.append(self.path)
+        if path == '/slow':
+            time.sleep(SLOW_SECONDS)
+        elif path == '/hang':
+            self.server.release.wait(30)
+        elif path == '/error':
+            self.send_error(500)
+            return
+        elif path == '/etag' and self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        if path == '/etag':
+            self.send_header('ETag', ETAG)
+        self.end_headers()
+        self.wfile.write(f'<h2>{path}</h2>'.encode())
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    httpd.hits = []
+    httpd.release = threading.Event()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    iusa_news.clear_cache()
+    yield
+    iusa_news.clear_cache()
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def test_sources_are_fetched_concurrently(server):
+    _, base = server
+    urls = [f'{base}/slow?{i}' for i in range(4)]
+    (pages, missing), seconds = timed(iusa_news.fetch_pages, urls, timeout=5, budget=5)
+    assert list(pages) == urls
+    assert missing == []
+    assert seconds < 2 * SLOW_SECONDS
+
+def test_budget_bounds_wall_time_and_reports_missing(server):
+    _, base = server
+    urls = [f'{base}/fast', f'{base}/slow', f'{base}/hang', f'{base}/error']
+    budget = 1.0
+    (pages, missing), seconds = timed(iusa_news.fetch_pages, urls, timeout=10, budget=budget)
+    assert seconds < budget + SLACK
+    assert list(pages) == [f'{base}/fast', f'{base}/slow']
+    assert missing == [f'{base}/hang', f'{base}/error']
+
+def test_source_timeout_ends_a_hanging_source_early(server):
+    _, base = server
+    (pages, missing), seconds = timed(iusa_news.fetch_pages, [f'{base}/fast', f'{base}/hang'], timeout=0.3, budget=10)
+    assert seconds < 0.3 + SLACK
+    assert list(pages) == [f'{base}/fast']
+    assert missing == [f'{base}/hang']
+
+def test_parse_failures_count_as_missing(server):
+    _, base = server
+    def parser(content):
+        if b'/slow' in content:
+            raise ValueError('unparseable')
+        return [content.decode()]
+    urls = [f'{base}/fast', f'{base}/slow', f'{base}/error']
+    headlines, missing = iusa_news.fetch_headlines(urls, 'test', parser, timeout=5, budget=5)
+    assert headlines == {f'{base}/fast': ['<h2>/fast</h2>']}
+    assert sorted(missing) == sorted([f'{base}/slow', f'{base}/error'])
+
+def counting_parser(calls):
+    def parser(content):
+        calls.append(content)
+        return [content.decode()]
+    return parser
+
+def test_not_modified_reuses_cached_parse(server, monkeypatch):
+    httpd, base = server
+    monkeypatch.setattr(iusa_news, 'DEFAULT_TTL', 0)  # revalidate on every fetch
+    calls = []
+    url = f'{base}/etag'
+    first, _ = iusa_news.fetch_headlines([url], 'test', counting_parser(calls))
+    second, missing = iusa_news.fetch_headlines([url], 'test', counting_parser(calls))
+    assert httpd.hits == ['/etag', '/etag']  # the second fetch was a conditional GET answered 304
+    assert missing == []
+    assert second == first
+    assert len(calls) == 1
+
+def test_fresh_page_is_not_requested_again(server):
+    httpd, base = server
+    calls = []
+    for _ in range(2):
+        headlines, _ = iusa_news.fetch_headlines([f'{base}/fast'], 'test', counting_parser(calls))
+    assert httpd.hits == ['/fast']
+    assert len(calls) == 1